@@ -1,22 +1,70 @@
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+import logging
 import uvicorn
 import os
 from dotenv import load_dotenv
-from src.presentation.api.slack_endpoints import router as slack_router
+from src.presentation.api.slack.config import get_settings
+from src.presentation.api.slack_endpoints import (
+    router as slack_router,
+    dm_dispatcher,
+    task_metrics_service,
+)
 
 # 環境変数をロード
 load_dotenv()
 
+# loggingの出力レベル（未設定ならINFO）。無効なレベルのログは文字列整形も行われない
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
+logger = logging.getLogger(__name__)
+
+# 終了時に送信待ちのDMを待つ最大秒数
+DM_DISPATCH_SHUTDOWN_TIMEOUT_SECONDS = 10.0
+# 終了時に待機中の担当者サマリー再集計を待つ最大秒数
+SUMMARY_REFRESH_SHUTDOWN_TIMEOUT_SECONDS = 10.0
+
+
+async def _finish_on_shutdown(awaitable, timeout: float, description: str) -> None:
+    """終了時の後処理を上限時間付きで待つ（失敗しても終了は妨げない）"""
+    try:
+        await asyncio.wait_for(awaitable, timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning("⚠️ %sを%s秒以内に完了できませんでした", description, timeout)
+    except Exception as error:
+        logger.warning("⚠️ %sに失敗しました: %s", description, error)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # キューに残ったDMと遅延中のサマリー再集計を並行して片付けてから終了する
+    await asyncio.gather(
+        _finish_on_shutdown(
+            dm_dispatcher.join(),
+            DM_DISPATCH_SHUTDOWN_TIMEOUT_SECONDS,
+            "送信待ちのSlack DMの送信",
+        ),
+        _finish_on_shutdown(
+            task_metrics_service.flush_pending_summary_refresh(),
+            SUMMARY_REFRESH_SHUTDOWN_TIMEOUT_SECONDS,
+            "担当者サマリーの再集計",
+        ),
+    )
+
+
 def create_app() -> FastAPI:
     """アプリケーションファクトリー"""
-    env = os.getenv("ENV", "local")
-    app_suffix = "" if env == "production" else " (Dev)"
+    settings = get_settings()
+    env = settings.env
+    app_suffix = settings.app_name_suffix
 
     app = FastAPI(
         title=f"Slack-Notion Task Management System{app_suffix}",
         description="Slack経由でタスク依頼を作成し、Notionに保存するシステム",
         version="1.0.0",
+        lifespan=lifespan,
     )
 
     # CORS設定
@@ -31,13 +79,16 @@ def create_app() -> FastAPI:
     # ルーターの登録
     app.include_router(slack_router)
 
+    # 内容は起動後に変わらないため、リクエストごとに組み立てず使い回す
+    root_response = {
+        "message": f"Slack-Notion Task Management System{app_suffix} is running",
+        "environment": env,
+        "version": "1.0.0"
+    }
+
     @app.get("/")
     async def root():
-        return {
-            "message": f"Slack-Notion Task Management System{app_suffix} is running",
-            "environment": env,
-            "version": "1.0.0"
-        }
+        return root_response
 
     @app.get("/health")
     async def health_check():
@@ -48,8 +99,7 @@ def create_app() -> FastAPI:
 app = create_app()
 
 if __name__ == "__main__":
-    env = os.getenv("ENV", "local")
-    is_prod = env == "production"
+    is_prod = get_settings().env == "production"
 
     # 本番は reload=False、開発は True
     reload_flag = not is_prod
@@ -1,9 +1,13 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from typing import Optional, Union, Dict, Any
 from enum import Enum
 
 
+# DTOは生成後に変更しないため凍結し、未知のフィールドは検証せず捨てる
+_DTO_CONFIG = ConfigDict(frozen=True, extra="ignore")
+
+
 class TaskStatusDto(str, Enum):
     PENDING = "pending"
     APPROVED = "approved"
@@ -11,6 +15,8 @@ class TaskStatusDto(str, Enum):
 
 class CreateTaskRequestDto(BaseModel):
     """タスク作成リクエストDTO"""
+    model_config = _DTO_CONFIG
+
     requester_slack_id: str = Field(..., description="依頼者のSlackユーザーID")
     assignee_slack_id: str = Field(..., description="依頼先のSlackユーザーID")
     title: str = Field(..., description="タスクタイトル")
@@ -22,6 +28,8 @@ class CreateTaskRequestDto(BaseModel):
 
 class ReviseTaskRequestDto(BaseModel):
     """タスク修正リクエストDTO"""
+    model_config = _DTO_CONFIG
+
     task_id: str = Field(..., description="既存タスクID")
     requester_slack_id: str = Field(..., description="依頼者のSlackユーザーID")
     assignee_slack_id: str = Field(..., description="依頼先のSlackユーザーID")
@@ -34,6 +42,8 @@ class ReviseTaskRequestDto(BaseModel):
 
 class TaskApprovalDto(BaseModel):
     """タスク承認/差し戻しDTO"""
+    model_config = _DTO_CONFIG
+
     task_id: str = Field(..., description="タスクID")
     action: str = Field(..., description="承認(approve)または差し戻し(reject)")
     rejection_reason: Optional[str] = Field(None, description="差し戻し理由")
@@ -41,6 +51,8 @@ class TaskApprovalDto(BaseModel):
 
 class TaskResponseDto(BaseModel):
     """タスクレスポンスDTO"""
+    model_config = ConfigDict(frozen=True, extra="ignore", from_attributes=True)
+
     id: str
     requester_slack_id: str
     assignee_slack_id: str
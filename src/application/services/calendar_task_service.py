@@ -1,10 +1,22 @@
-from typing import Optional, Dict, Any
+import logging
+import re
+import time
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 from src.domain.entities.calendar_task import CalendarTask
 from src.domain.repositories.calendar_task_repository import CalendarTaskRepository
 from src.application.services.user_mapping_service import UserMappingApplicationService
 
 
+logger = logging.getLogger(__name__)
+
+# 日付のみ（YYYY-MM-DD）の納期形式
+_DATE_ONLY_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# SlackユーザーID → メールアドレスのキャッシュ保持秒数（メール変更は期限切れ後に反映される）
+EMAIL_CACHE_TTL_SECONDS = 3600.0
+
+
 class CalendarTaskApplicationService:
     """カレンダータスクのアプリケーションサービス
 
@@ -21,6 +33,8 @@ class CalendarTaskApplicationService:
         """
         self.calendar_task_repository = calendar_task_repository
         self.user_mapping_service = user_mapping_service
+        # 承認者は少数に限られるため、SlackユーザーID → メールアドレスをキャッシュする
+        self._email_cache: Dict[str, Tuple[float, str]] = {}
 
     async def create_task_on_approval(self,
                                      task_data: Dict[str, Any],
@@ -38,28 +52,31 @@ class CalendarTaskApplicationService:
             # 承認者のメールアドレスを取得
             approver_email = await self._get_user_email(approver_slack_user_id)
             if not approver_email:
-                print(f"Could not find email for user {approver_slack_user_id}")
+                logger.warning("Could not find email for user %s", approver_slack_user_id)
                 return None
 
+            # 承認日時と作成日時は同じ時刻を使う
+            now = datetime.now()
+
             # タスクエンティティを作成
             calendar_task = CalendarTask(
                 id=None,
                 title=task_data.get('title', 'タスク'),
-                notes=self._format_task_notes(task_data),
+                notes=self._format_task_notes(task_data, now),
                 due_date=self._parse_due_date(task_data.get('due_date')),
                 user_email=approver_email,
                 task_request_id=task_data.get('id', ''),
-                created_at=datetime.now()
+                created_at=now
             )
 
             # Googleカレンダーにタスクを作成
             created_task = await self.calendar_task_repository.create(calendar_task)
 
-            print(f"✅ Calendar task created for {approver_email}")
+            logger.info("✅ Calendar task created for %s", approver_email)
             return created_task
 
         except Exception as e:
-            print(f"Error creating calendar task: {e}")
+            logger.error("Error creating calendar task: %s", e)
             return None
 
     async def _get_user_email(self, slack_user_id: str) -> Optional[str]:
@@ -71,24 +88,33 @@ class CalendarTaskApplicationService:
         Returns:
             ユーザーのメールアドレス
         """
+        cached = self._email_cache.get(slack_user_id)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+
         try:
             # ユーザーマッピングサービスを使用してSlackユーザー情報を取得
             slack_user = await self.user_mapping_service.slack_user_repository.find_by_id(slack_user_id)
 
             if slack_user and slack_user.email:
+                self._email_cache[slack_user_id] = (
+                    time.monotonic() + EMAIL_CACHE_TTL_SECONDS,
+                    slack_user.email.value,
+                )
                 return slack_user.email.value
 
             return None
 
         except Exception as e:
-            print(f"Error getting user email: {e}")
+            logger.error("Error getting user email: %s", e)
             return None
 
-    def _format_task_notes(self, task_data: Dict[str, Any]) -> str:
+    def _format_task_notes(self, task_data: Dict[str, Any], approved_at: datetime) -> str:
         """タスクの詳細情報をフォーマット
 
         Args:
             task_data: タスクデータ
+            approved_at: 承認日時
 
         Returns:
             フォーマットされた詳細テキスト
@@ -108,7 +134,7 @@ class CalendarTaskApplicationService:
             notes_parts.append(f"\nNotion: {task_data['notion_url']}")
 
         # 承認日時
-        notes_parts.append(f"\n承認日時: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+        notes_parts.append(f"\n承認日時: {approved_at:%Y-%m-%d %H:%M}")
 
         return "\n".join(notes_parts)
 
@@ -125,17 +151,20 @@ class CalendarTaskApplicationService:
             return None
 
         try:
-            # ISO形式を試す
+            # ISO形式（Python 3.11以降のfromisoformatは末尾のZも解釈できる）
             if 'T' in due_date_str:
-                return datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
+                return datetime.fromisoformat(due_date_str)
 
-            # 日付のみの形式を試す
-            return datetime.strptime(due_date_str, '%Y-%m-%d')
+            # 日付のみの形式（形式判定は正規表現で行い、strptimeを通さない）
+            if _DATE_ONLY_RE.fullmatch(due_date_str):
+                return datetime.fromisoformat(due_date_str)
 
-        except (ValueError, AttributeError):
-            # パースに失敗した場合はNoneを返す
-            print(f"Could not parse due date: {due_date_str}")
-            return None
+        except (ValueError, TypeError):
+            pass
+
+        # パースに失敗した場合はNoneを返す
+        logger.warning("Could not parse due date: %s", due_date_str)
+        return None
 
     async def get_tasks_for_request(self, task_request_id: str) -> list:
         """タスク依頼に関連するカレンダータスクを取得
@@ -150,5 +179,5 @@ class CalendarTaskApplicationService:
             tasks = await self.calendar_task_repository.find_by_task_request_id(task_request_id)
             return tasks
         except Exception as e:
-            print(f"Error getting tasks for request: {e}")
+            logger.error("Error getting tasks for request: %s", e)
             return []
\ No newline at end of file
@@ -1,16 +1,49 @@
+import asyncio
 import logging
-from datetime import datetime, timezone
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 from zoneinfo import ZoneInfo
 
 from src.domain.entities.task import TaskRequest
 from src.domain.repositories.slack_user_repository import SlackUserRepositoryInterface
 from src.domain.value_objects.email import Email
+from src.infrastructure.slack.dm_dispatcher import SlackDirectMessageDispatcher
 from src.infrastructure.slack.slack_service import SlackService
+from src.utils.concurrency import ConcurrencyCoordinator
 
 logger = logging.getLogger(__name__)
 
 JST = ZoneInfo("Asia/Tokyo")
+# JSTは夏時間がないため、UTCオフセットが+9時間なら変換不要と判定できる
+_JST_UTC_OFFSET = timedelta(hours=9)
+
+# 通知DMの同時送信数の上限（Slack APIへのバースト抑制）
+BROADCAST_MAX_CONCURRENCY = 8
+
+# メール→SlackユーザーIDキャッシュ（LRU + TTL）
+EMAIL_CACHE_MAX_ENTRIES = 512
+EMAIL_CACHE_TTL_SECONDS = 3600.0
+# 検索エラー時は短時間だけ結果なしとして扱い、通知が続く間の再検索を抑える
+EMAIL_CACHE_ERROR_TTL_SECONDS = 60.0
+
+# 通知ブロックの不変部分（送信時に変更されないため共有して使い回す）
+_TASK_APPROVED_HEADER_BLOCK: Dict[str, Any] = {
+    "type": "section",
+    "text": {"type": "mrkdwn", "text": "✅ *【通知】タスクが発生しました*"},
+}
+_COMPLETION_APPROVED_HEADER_BLOCK: Dict[str, Any] = {
+    "type": "section",
+    "text": {"type": "mrkdwn", "text": "🏁 *【通知】タスクが完了しました*"},
+}
+
+
+@lru_cache(maxsize=1024)
+def _notion_page_url(notion_page_id: str) -> str:
+    """ページIDからURLを生成（同じページへの通知が続くためメモ化する）"""
+    return f"https://www.notion.so/{notion_page_id.replace('-', '')}"
 
 
 class TaskEventNotificationService:
@@ -21,11 +54,19 @@ class TaskEventNotificationService:
         slack_service: SlackService,
         slack_user_repository: SlackUserRepositoryInterface,
         notification_emails: Sequence[str],
+        dm_dispatcher: Optional[SlackDirectMessageDispatcher] = None,
     ) -> None:
         self._slack_service = slack_service
         self._slack_user_repository = slack_user_repository
-        self._emails: List[Email] = self._normalize_emails(notification_emails)
-        self._email_cache: Dict[str, Optional[str]] = {}
+        # 指定時はDM送信をキュー経由のバックグラウンド送信にし、呼び出し側を待たせない
+        self._dm_dispatcher = dm_dispatcher
+        # (正規化済みEmail, キャッシュキー) の組。通知ごとの正規化・文字列化を避けるため起動時に確定させる
+        self._emails: Tuple[Tuple[Email, str], ...] = self._normalize_emails(notification_emails)
+        # 正規化済みメール -> (SlackユーザーID or None, 有効期限のmonotonic時刻)
+        self._email_cache: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+        # 検索中の正規化済みメール -> 結果のFuture（同時通知での重複検索をまとめる）
+        self._inflight_lookups: Dict[str, "asyncio.Future[Optional[str]]"] = {}
+        self._send_concurrency = ConcurrencyCoordinator(max_concurrency=BROADCAST_MAX_CONCURRENCY)
 
     @property
     def enabled(self) -> bool:
@@ -47,7 +88,6 @@ class TaskEventNotificationService:
         due_text = self._format_datetime(task.due_date)
         approval_text = self._format_datetime(approval_time)
 
-        header_text = "✅ *【通知】タスクが発生しました*"
         if notion_url:
             task_line = f"<{notion_url}|{task.title}>"
         else:
@@ -56,29 +96,16 @@ class TaskEventNotificationService:
         from_person = self._format_person_line(requester_name, task.requester_slack_id)
         to_person = self._format_person_line(assignee_name, task.assignee_slack_id)
 
-        fields = [
-            {"type": "mrkdwn", "text": f"*タスク*\n{task_line}"},
-            {"type": "mrkdwn", "text": f"*納期*\n{due_text}"},
-            {
-                "type": "mrkdwn",
-                "text": f"*From*\n{from_person}",
-            },
-            {
-                "type": "mrkdwn",
-                "text": f"*To*\n{to_person}",
-            },
-        ]
-
-        blocks = [
-            {"type": "section", "text": {"type": "mrkdwn", "text": header_text}},
-            {"type": "section", "fields": fields},
-            {
-                "type": "context",
-                "elements": [
-                    {"type": "mrkdwn", "text": f"発生日時: {approval_text}"},
-                ],
-            },
-        ]
+        blocks = self._build_blocks(
+            _TASK_APPROVED_HEADER_BLOCK,
+            (
+                ("タスク", task_line),
+                ("納期", due_text),
+                ("From", from_person),
+                ("To", to_person),
+            ),
+            footer_text=f"発生日時: {approval_text}",
+        )
 
         text = f"[通知] タスクが発生: {task.title}"
         await self._broadcast(text=text, blocks=blocks)
@@ -104,8 +131,6 @@ class TaskEventNotificationService:
         approval_text = self._format_datetime(approval_time)
         overdue_flag, overdue_label = self._completion_due_status(due_date, approval_time)
 
-        header_text = "🏁 *【通知】タスクが完了しました*"
-
         if notion_url:
             task_line = f"<{notion_url}|{title}>"
         else:
@@ -114,98 +139,161 @@ class TaskEventNotificationService:
         from_person = self._format_person_line(requester_name, requester_slack_id)
         to_person = self._format_person_line(assignee_name, assignee_slack_id)
 
-        fields = [
-            {"type": "mrkdwn", "text": f"*タスク*\n{task_line}"},
-            {"type": "mrkdwn", "text": f"*納期*\n{due_text}"},
-            {
-                "type": "mrkdwn",
-                "text": f"*ステータス*\n{overdue_flag}",
-            },
-            {
-                "type": "mrkdwn",
-                "text": f"*完了承認日時*\n{approval_text}",
-            },
-            {
-                "type": "mrkdwn",
-                "text": f"*From*\n{from_person}",
-            },
-            {
-                "type": "mrkdwn",
-                "text": f"*To*\n{to_person}",
-            },
-        ]
+        blocks = self._build_blocks(
+            _COMPLETION_APPROVED_HEADER_BLOCK,
+            (
+                ("タスク", task_line),
+                ("納期", due_text),
+                ("ステータス", overdue_flag),
+                ("完了承認日時", approval_text),
+                ("From", from_person),
+                ("To", to_person),
+            ),
+        )
 
-        blocks = [
+        text = f"[通知] タスクが完了: {title} ({overdue_flag})"
+        await self._broadcast(text=text, blocks=blocks)
+
+    @staticmethod
+    def _build_blocks(
+        header_block: Dict[str, Any],
+        field_pairs: Sequence[Tuple[str, str]],
+        footer_text: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """ヘッダー + 項目セクション（+ 任意のフッター）の通知ブロックを組み立てる"""
+        blocks: List[Dict[str, Any]] = [
+            header_block,
             {
                 "type": "section",
-                "text": {"type": "mrkdwn", "text": header_text},
+                "fields": [
+                    {"type": "mrkdwn", "text": f"*{label}*\n{value}"}
+                    for label, value in field_pairs
+                ],
             },
-            {"type": "section", "fields": fields},
         ]
-
-        text = f"[通知] タスクが完了: {title} ({overdue_flag})"
-        await self._broadcast(text=text, blocks=blocks)
-
-    def _normalize_emails(self, raw_emails: Sequence[str]) -> List[Email]:
-        normalized: List[Email] = []
+        if footer_text:
+            blocks.append(
+                {"type": "context", "elements": [{"type": "mrkdwn", "text": footer_text}]}
+            )
+        return blocks
+
+    def _normalize_emails(self, raw_emails: Sequence[str]) -> Tuple[Tuple[Email, str], ...]:
+        normalized: List[Tuple[Email, str]] = []
         for raw in raw_emails:
             email = (raw or "").strip()
             if not email:
                 continue
             try:
-                normalized.append(Email(email))
+                normalized_email = Email(email).normalized()
             except ValueError:
                 logger.warning("⚠️ 通知用メールアドレスが不正です: %s", email)
-        return normalized
+                continue
+            normalized.append((normalized_email, normalized_email.value))
+        return tuple(normalized)
 
     async def _broadcast(self, *, text: str, blocks: List[Dict[str, Any]]) -> None:
-        for email in self._emails:
-            slack_user_id = await self._resolve_slack_user_id(email)
+        # 宛先の解決と送信はそれぞれ全員分を並行して行う
+        slack_user_ids = await asyncio.gather(
+            *(self._resolve_slack_user_id(email, key) for email, key in self._emails)
+        )
+
+        recipients: List[Tuple[Email, str]] = []
+        for (email, _), slack_user_id in zip(self._emails, slack_user_ids):
             if not slack_user_id:
                 logger.warning("⚠️ Slackユーザーが見つかりませんでした: %s", email)
                 continue
-            try:
-                await self._slack_service.send_direct_message(
+            recipients.append((email, slack_user_id))
+
+        if self._dm_dispatcher:
+            for email, slack_user_id in recipients:
+                self._dm_dispatcher.enqueue(
                     slack_user_id,
                     text=text,
                     blocks=blocks,
+                    label=f"email={email}",
                 )
-            except Exception as error:
+            return
+
+        results = await asyncio.gather(
+            *(
+                self._send_concurrency.run(
+                    self._slack_service.send_direct_message,
+                    slack_user_id,
+                    text=text,
+                    blocks=blocks,
+                )
+                for _, slack_user_id in recipients
+            ),
+            return_exceptions=True,
+        )
+        for (email, _), result in zip(recipients, results):
+            if isinstance(result, Exception):
                 logger.error(
                     "⚠️ タスクイベント通知の送信に失敗しました (email=%s): %s",
                     email,
-                    error,
+                    result,
                 )
 
-    async def _resolve_slack_user_id(self, email: Email) -> Optional[str]:
-        normalized_email = email.normalized()
-        key = str(normalized_email)
-        if key in self._email_cache:
-            return self._email_cache[key]
+    async def _resolve_slack_user_id(self, email: Email, key: str) -> Optional[str]:
+        """正規化済みのメールとそのキャッシュキーからSlackユーザーIDを解決"""
+        cached = self._email_cache.get(key)
+        if cached and time.monotonic() < cached[1]:
+            self._email_cache.move_to_end(key)
+            return cached[0]
 
-        try:
-            slack_user = await self._slack_user_repository.find_by_email(normalized_email)
-        except Exception as error:
-            logger.error("⚠️ Slackユーザー検索に失敗しました (email=%s): %s", email, error)
-            slack_user = None
+        inflight = self._inflight_lookups.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
 
-        slack_user_id = str(slack_user.user_id) if slack_user else None
-        self._email_cache[key] = slack_user_id
-        return slack_user_id
+        future: "asyncio.Future[Optional[str]]" = asyncio.get_running_loop().create_future()
+        self._inflight_lookups[key] = future
+        slack_user_id: Optional[str] = None
+        try:
+            ttl = EMAIL_CACHE_TTL_SECONDS
+            try:
+                slack_user = await self._slack_user_repository.find_by_email(email)
+            except Exception as error:
+                logger.error("⚠️ Slackユーザー検索に失敗しました (email=%s): %s", email, error)
+                slack_user = None
+                ttl = EMAIL_CACHE_ERROR_TTL_SECONDS
+
+            slack_user_id = slack_user.user_id.value if slack_user else None
+            self._remember_slack_user_id(key, slack_user_id, ttl)
+            return slack_user_id
+        finally:
+            # 検索側がキャンセルされた場合も待機中の呼び出しを解放する（その場合は宛先なし扱い）
+            self._inflight_lookups.pop(key, None)
+            if not future.done():
+                future.set_result(slack_user_id)
+
+    def _remember_slack_user_id(self, key: str, slack_user_id: Optional[str], ttl: float) -> None:
+        self._email_cache[key] = (slack_user_id, time.monotonic() + ttl)
+        self._email_cache.move_to_end(key)
+        while len(self._email_cache) > EMAIL_CACHE_MAX_ENTRIES:
+            self._email_cache.popitem(last=False)
 
     def _build_notion_url(self, notion_page_id: Optional[str]) -> Optional[str]:
         if not notion_page_id:
             return None
-        return f"https://www.notion.so/{notion_page_id.replace('-', '')}"
+        return _notion_page_url(notion_page_id)
 
     def _format_datetime(self, value: Optional[datetime]) -> str:
         if not value:
             return "未設定"
         localized = self._ensure_jst(value)
-        return localized.strftime("%Y-%m-%d %H:%M")
+        return (
+            f"{localized.year:04d}-{localized.month:02d}-{localized.day:02d} "
+            f"{localized.hour:02d}:{localized.minute:02d}"
+        )
 
     def _ensure_jst(self, value: datetime) -> datetime:
-        if value.tzinfo:
+        tzinfo = value.tzinfo
+        if tzinfo is JST:
+            return value
+        if tzinfo:
+            # 表示用途のため、オフセットが同じなら別のタイムゾーン表現でもそのまま使う
+            if value.utcoffset() == _JST_UTC_OFFSET:
+                return value
             return value.astimezone(JST)
         return value.replace(tzinfo=JST)
 
@@ -225,9 +313,12 @@ class TaskEventNotificationService:
         return "納期超過", "納期超過"
 
     def _to_utc(self, value: datetime) -> datetime:
+        if value.tzinfo is timezone.utc:
+            return value
         if value.tzinfo:
             return value.astimezone(timezone.utc)
-        return value.replace(tzinfo=JST).astimezone(timezone.utc)
+        # naiveはJSTとみなす。JSTは固定オフセットのため、zoneinfoを介さず差し引くだけでよい
+        return (value - _JST_UTC_OFFSET).replace(tzinfo=timezone.utc)
 
     def _format_person_line(self, name: str, slack_id: Optional[str]) -> str:
         if slack_id:
@@ -1,13 +1,35 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+from dataclasses import replace
 from datetime import datetime, timezone
-from typing import Dict, Iterable, Optional, Sequence
+from typing import Any, Dict, Iterable, Optional, Sequence
 
 from src.domain.entities.task_metrics import TaskMetricsRecord
 from src.domain.services.task_metrics_domain_service import TaskMetricsDomainService
 from src.infrastructure.notion.admin_metrics_service import AdminMetricsNotionService
 from src.infrastructure.notion.dynamic_notion_service import NotionTaskSnapshot
 
+logger = logging.getLogger(__name__)
+
+# タスクイベント後の担当者サマリー再集計をまとめる待機時間（秒）
+SUMMARY_REFRESH_DEBOUNCE_SECONDS = 30.0
+# 遅延再集計が連続で失敗した場合に再試行する上限（以降は次のイベントか終了時のフラッシュで再実行）
+SUMMARY_REFRESH_MAX_ATTEMPTS = 3
+
+# sync_snapshot で既存メトリクスが未取得であることを示す番兵
+_NOT_FETCHED: Any = object()
+
+
+def _as_utc(value: datetime) -> datetime:
+    """UTCのaware datetimeに揃える（既にUTCなら変換しない。naiveはUTCとみなす）"""
+    if value.tzinfo is timezone.utc:
+        return value
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
 
 class _DisabledAdminMetricsService:
     """No-op replacement for AdminMetricsNotionService when metrics更新を無効化する場合に使用。"""
@@ -15,6 +37,9 @@ class _DisabledAdminMetricsService:
     async def get_metrics_by_task_id(self, task_page_id: str) -> Optional[TaskMetricsRecord]:
         return None
 
+    async def fetch_metrics_by_task_ids(self, task_page_ids: Sequence[str]) -> Dict[str, TaskMetricsRecord]:
+        return {}
+
     async def upsert_task_metrics(self, record: TaskMetricsRecord) -> TaskMetricsRecord:
         return record
 
@@ -52,6 +77,9 @@ class TaskMetricsApplicationService:
             admin_metrics_service if enabled else _DisabledAdminMetricsService()
         )
         self.domain_service = domain_service or TaskMetricsDomainService()
+        # 担当者サマリーの再集計待ちフラグと、遅延実行中のタスク
+        self._summary_dirty = False
+        self._summary_refresh_task: Optional[asyncio.Task] = None
 
     async def ensure_metrics_for_snapshots(
         self,
@@ -59,11 +87,22 @@ class TaskMetricsApplicationService:
     ) -> Dict[str, TaskMetricsRecord]:
         if not self.enabled:
             return {}
-        metrics: Dict[str, TaskMetricsRecord] = {}
-        for snapshot in snapshots:
-            record = await self.sync_snapshot(snapshot)
-            metrics[snapshot.page_id] = record
-        return metrics
+        snapshot_list = list(snapshots)
+        # 既存メトリクスは一括取得し、スナップショットごとの検索クエリを省く
+        existing_records = await self.admin_metrics_service.fetch_metrics_by_task_ids(
+            [snapshot.page_id for snapshot in snapshot_list]
+        )
+        # 同時実行数はAdminMetricsNotionService側でNotionのレート制限内に抑えられる
+        records = await asyncio.gather(
+            *(
+                self.sync_snapshot(snapshot, existing=existing_records.get(snapshot.page_id))
+                for snapshot in snapshot_list
+            )
+        )
+        return {
+            snapshot.page_id: record
+            for snapshot, record in zip(snapshot_list, records)
+        }
 
     async def sync_snapshot(
         self,
@@ -71,50 +110,65 @@ class TaskMetricsApplicationService:
         *,
         reminder_stage: Optional[str] = None,
         overdue_points: Optional[int] = None,
+        existing: Optional[TaskMetricsRecord] = _NOT_FETCHED,
     ) -> TaskMetricsRecord:
+        """スナップショットをメトリクスに反映（existing 指定時は既存レコードの検索を省略）"""
         now_utc = datetime.now(timezone.utc)
-        record = TaskMetricsRecord(
-            task_page_id=snapshot.page_id,
-            task_title=snapshot.title,
-            assignee_email=snapshot.assignee_email,
-            assignee_notion_id=snapshot.assignee_notion_id,
-            assignee_name=None,
-            due_date=snapshot.due_date,
-            status=snapshot.status,
-            reminder_stage=reminder_stage or snapshot.reminder_stage,
-            overdue_points=overdue_points if overdue_points is not None else 0,
-            completion_status=snapshot.completion_status,
-            extension_status=snapshot.extension_status,
-        )
+        if existing is _NOT_FETCHED:
+            existing = None
+            if self.enabled:
+                existing = await self.admin_metrics_service.get_metrics_by_task_id(snapshot.page_id)
+
+        if overdue_points is not None:
+            points = overdue_points
+        else:
+            points = existing.overdue_points if existing else 0
+            # 延期などで納期が未来になった場合はポイントを必ず0にする（即時リセット）
+            if points and snapshot.due_date and _as_utc(snapshot.due_date) > now_utc:
+                points = 0
 
-        existing: Optional[TaskMetricsRecord] = None
-        if self.enabled:
-            existing = await self.admin_metrics_service.get_metrics_by_task_id(snapshot.page_id)
         if existing:
-            record.metrics_page_id = existing.metrics_page_id
-            record.assignee_name = existing.assignee_name
-            record.last_synced_at = datetime.now(timezone.utc)
-            if record.assignee_email is None:
-                record.assignee_email = existing.assignee_email
-            if record.assignee_notion_id is None:
-                record.assignee_notion_id = existing.assignee_notion_id
-            if reminder_stage is None:
-                record.reminder_stage = existing.reminder_stage
-            if overdue_points is None:
-                record.overdue_points = existing.overdue_points
+            # 既存レコードを起点に差分だけ置き換える（既存側は一括取得結果で共有されるため変更しない）
+            record = replace(
+                existing,
+                task_title=snapshot.title,
+                assignee_email=(
+                    snapshot.assignee_email
+                    if snapshot.assignee_email is not None
+                    else existing.assignee_email
+                ),
+                assignee_notion_id=(
+                    snapshot.assignee_notion_id
+                    if snapshot.assignee_notion_id is not None
+                    else existing.assignee_notion_id
+                ),
+                due_date=snapshot.due_date,
+                status=snapshot.status,
+                reminder_stage=(
+                    existing.reminder_stage
+                    if reminder_stage is None
+                    else reminder_stage or snapshot.reminder_stage
+                ),
+                overdue_points=points,
+                completion_status=snapshot.completion_status,
+                extension_status=snapshot.extension_status,
+                last_synced_at=now_utc,
+            )
         else:
-            record.last_synced_at = now_utc
-            if overdue_points is None:
-                record.overdue_points = 0
-
-        # 延期などで納期が未来になった場合はポイントを必ず0にする（即時リセット）
-        if overdue_points is None:
-            if record.due_date and record.due_date.tzinfo:
-                due_utc = record.due_date.astimezone(timezone.utc)
-            else:
-                due_utc = record.due_date.replace(tzinfo=timezone.utc) if record.due_date else None
-            if due_utc and due_utc > now_utc:
-                record.overdue_points = 0
+            record = TaskMetricsRecord(
+                task_page_id=snapshot.page_id,
+                task_title=snapshot.title,
+                assignee_email=snapshot.assignee_email,
+                assignee_notion_id=snapshot.assignee_notion_id,
+                assignee_name=None,
+                due_date=snapshot.due_date,
+                status=snapshot.status,
+                reminder_stage=reminder_stage or snapshot.reminder_stage,
+                overdue_points=points,
+                completion_status=snapshot.completion_status,
+                extension_status=snapshot.extension_status,
+                last_synced_at=now_utc,
+            )
 
         if not self.enabled:
             return record
@@ -136,11 +190,57 @@ class TaskMetricsApplicationService:
             return None
         return await self.admin_metrics_service.update_reminder_stage(task_page_id, stage, timestamp)
 
+    def schedule_assignee_summary_refresh(
+        self,
+        delay_seconds: float = SUMMARY_REFRESH_DEBOUNCE_SECONDS,
+    ) -> None:
+        """担当者サマリーの再集計を予約（待機中のイベントは1回の再集計にまとめる）"""
+        if not self.enabled:
+            return
+        self._summary_dirty = True
+        if self._summary_refresh_task and not self._summary_refresh_task.done():
+            return
+        self._summary_refresh_task = asyncio.get_running_loop().create_task(
+            self._run_debounced_summary_refresh(delay_seconds)
+        )
+
+    async def _run_debounced_summary_refresh(self, delay_seconds: float) -> None:
+        # 再集計中に新たなイベントが来た場合や失敗した場合は、もう一度待ってから再集計する
+        failures = 0
+        while self._summary_dirty and failures < SUMMARY_REFRESH_MAX_ATTEMPTS:
+            await asyncio.sleep(delay_seconds)
+            if not self._summary_dirty:
+                break
+            try:
+                await self.refresh_assignee_summaries()
+                failures = 0
+            except Exception as error:
+                failures += 1
+                logger.warning("⚠️ Assignee summary refresh failed: %s", error)
+
+    async def flush_pending_summary_refresh(self) -> None:
+        """待機中の担当者サマリー再集計を待たずに実行する（終了時用）"""
+        task = self._summary_refresh_task
+        self._summary_refresh_task = None
+        if task and not task.done():
+            task.cancel()
+            # 待機（または実行中の再集計）の終了を待つ。キャンセルされた再集計は再集計待ちに戻る
+            await asyncio.gather(task, return_exceptions=True)
+        if self._summary_dirty:
+            await self.refresh_assignee_summaries()
+
     async def refresh_assignee_summaries(self) -> None:
         if not self.enabled:
             return None
-        metrics = await self.admin_metrics_service.fetch_all_metrics()
-        print(f"📈 Metrics fetched for summary: {len(metrics)} 件")
-        summaries = self.domain_service.build_assignee_summaries(metrics, datetime.now(timezone.utc))
-        print(f"🧾 Summaries to upsert: {len(summaries)} 件")
-        await self.admin_metrics_service.upsert_assignee_summaries(summaries)
+        # 直接の再集計で予約分も反映されるため、待機中の予約は不要になる
+        self._summary_dirty = False
+        try:
+            metrics = await self.admin_metrics_service.fetch_all_metrics()
+            logger.debug("📈 Metrics fetched for summary: %d 件", len(metrics))
+            summaries = self.domain_service.build_assignee_summaries(metrics, datetime.now(timezone.utc))
+            logger.debug("🧾 Summaries to upsert: %d 件", len(summaries))
+            await self.admin_metrics_service.upsert_assignee_summaries(summaries)
+        except BaseException:
+            # 失敗・中断した場合は反映されていないため、再集計待ちに戻す
+            self._summary_dirty = True
+            raise
@@ -1,4 +1,8 @@
-from typing import Optional
+import asyncio
+import logging
+from dataclasses import replace
+from operator import attrgetter
+from typing import Any, Awaitable, Dict, Optional
 from src.domain.entities.task import TaskRequest, TaskStatus
 from src.domain.entities.user import User
 from src.domain.repositories.task_repository import TaskRepositoryInterface
@@ -7,12 +11,22 @@ from src.application.dto.task_dto import (
     CreateTaskRequestDto,
     TaskApprovalDto,
     TaskResponseDto,
+    TaskStatusDto,
     ReviseTaskRequestDto,
 )
 from src.application.services.task_metrics_service import TaskMetricsApplicationService
 from src.application.services.task_event_notification_service import TaskEventNotificationService
+from src.infrastructure.notion.dynamic_notion_service import NotionTaskSnapshot, task_status_name
 from src.utils.concurrency import ConcurrencyCoordinator
 
+logger = logging.getLogger(__name__)
+
+# ドメインのタスクステータス -> レスポンスDTOのステータス
+_STATUS_TO_DTO = {status: TaskStatusDto(status.value) for status in TaskStatus}
+# エンティティからそのまま写すレスポンスDTOのフィールド（statusは別途変換）
+_RESPONSE_FIELDS = tuple(name for name in TaskResponseDto.model_fields if name != "status")
+_get_response_values = attrgetter(*_RESPONSE_FIELDS)
+
 
 class TaskApplicationService:
     """タスク管理アプリケーションサービス"""
@@ -38,20 +52,22 @@ class TaskApplicationService:
     async def create_task_request(self, dto: CreateTaskRequestDto) -> TaskResponseDto:
         """タスク依頼を作成"""
         # 依頼者と依頼先のユーザー情報を取得
-        requester = await self.slack_service.get_user_info(dto.requester_slack_id)
-        assignee = await self.slack_service.get_user_info(dto.assignee_slack_id)
+        requester, assignee = await asyncio.gather(
+            self.slack_service.get_user_info(dto.requester_slack_id),
+            self.slack_service.get_user_info(dto.assignee_slack_id),
+        )
 
-        print(f"🔍 Requester info: {requester}")
-        print(f"🔍 Assignee info: {assignee}")
+        logger.debug("🔍 Requester info: %s", requester)
+        logger.debug("🔍 Assignee info: %s", assignee)
 
-        requester_email = requester.get("profile", {}).get("email")
-        assignee_email = assignee.get("profile", {}).get("email")
+        requester_email = self._extract_email(requester)
+        assignee_email = self._extract_email(assignee)
 
-        print(f"📧 Requester email: {requester_email}")
-        print(f"📧 Assignee email: {assignee_email}")
+        logger.debug("📧 Requester email: %s", requester_email)
+        logger.debug("📧 Assignee email: %s", assignee_email)
 
         # タスクエンティティを作成
-        print(f"🔧 DTO values: task_type='{dto.task_type}', urgency='{dto.urgency}'")
+        logger.debug("🔧 DTO values: task_type='%s', urgency='%s'", dto.task_type, dto.urgency)
         
         task = TaskRequest(
             requester_slack_id=dto.requester_slack_id,
@@ -63,7 +79,7 @@ class TaskApplicationService:
             urgency=dto.urgency,
         )
         
-        print(f"🚀 Created task: task_type='{task.task_type}', urgency='{task.urgency}'")
+        logger.debug("🚀 Created task: task_type='%s', urgency='%s'", task.task_type, task.urgency)
 
         # 即座にNotionにタスクを保存（承認待ち状態で）
         notion_page_id = await self.notion_service.create_task(
@@ -81,28 +97,24 @@ class TaskApplicationService:
         saved_task = await self.task_repository.save(task)
 
         # 依頼先と依頼者の両方にDMで親メッセージを送信（スレッド対応）
-        assignee_name = assignee.get("real_name") or assignee.get("profile", {}).get("real_name", "Unknown")
-        requester_name = requester.get("real_name") or requester.get("profile", {}).get("real_name", "Unknown")
-
-        thread_info = await self.slack_service.send_approval_request(
-            assignee_slack_id=dto.assignee_slack_id,
-            requester_slack_id=dto.requester_slack_id,
-            task=saved_task,
-            requester_name=requester_name,
-            assignee_name=assignee_name,
+        # 承認ボタンとNotionリンクにページIDを埋め込むため、送信はNotion保存の完了後に行う
+        assignee_name = self._extract_name(assignee)
+        requester_name = self._extract_name(requester)
+
+        # メトリクス同期はDM送信と独立しているため並行して進める
+        # メトリクス同期の失敗はログのみとし、DM送信の失敗は従来どおり呼び出し元へ伝える
+        metrics_result, send_result = await asyncio.gather(
+            self._sync_metrics(task.notion_page_id),
+            self._send_approval_request_with_thread(
+                task=saved_task,
+                requester_name=requester_name,
+                assignee_name=assignee_name,
+            ),
+            return_exceptions=True,
         )
-
-        # スレッド情報をNotionに保存
-        if thread_info and task.notion_page_id:
-            await self.notion_service.save_thread_info(
-                page_id=task.notion_page_id,
-                assignee_thread_ts=thread_info.get("assignee_thread_ts"),
-                assignee_thread_channel=thread_info.get("assignee_thread_channel"),
-                requester_thread_ts=thread_info.get("requester_thread_ts"),
-                requester_thread_channel=thread_info.get("requester_thread_channel"),
-            )
-
-        await self._sync_metrics(task.notion_page_id)
+        self._log_side_effect_failure("metrics sync", metrics_result)
+        if isinstance(send_result, BaseException):
+            raise send_result
 
         return self._to_response_dto(saved_task)
 
@@ -122,11 +134,13 @@ class TaskApplicationService:
     async def _revise_task_request_locked(self, task: TaskRequest, dto: ReviseTaskRequestDto) -> TaskResponseDto:
         requester_slack_id = dto.requester_slack_id
         
-        requester_info = await self.slack_service.get_user_info(requester_slack_id)
-        assignee_info = await self.slack_service.get_user_info(dto.assignee_slack_id)
+        requester_info, assignee_info = await asyncio.gather(
+            self.slack_service.get_user_info(requester_slack_id),
+            self.slack_service.get_user_info(dto.assignee_slack_id),
+        )
 
-        requester_email = requester_info.get("profile", {}).get("email")
-        assignee_email = assignee_info.get("profile", {}).get("email")
+        requester_email = self._extract_email(requester_info)
+        assignee_email = self._extract_email(assignee_info)
 
         task.revise(
             assignee_slack_id=dto.assignee_slack_id,
@@ -155,19 +169,68 @@ class TaskApplicationService:
 
         updated_task = await self.task_repository.update(task)
 
-        requester_name = requester_info.get("real_name") or requester_info.get("profile", {}).get("real_name", "Unknown")
-        assignee_name = assignee_info.get("real_name") or assignee_info.get("profile", {}).get("real_name", "Unknown")
+        requester_name = self._extract_name(requester_info)
+        assignee_name = self._extract_name(assignee_info)
 
-        # 依頼先と依頼者の両方にDMで親メッセージを送信（スレッド対応）
+        # DM送信・監査ログ・メトリクス同期は互いに独立しているため並行して進める
+        metrics_result, send_result, audit_result = await asyncio.gather(
+            self._sync_metrics(task.notion_page_id),
+            self._send_approval_request_with_thread(
+                task=updated_task,
+                requester_name=requester_name,
+                assignee_name=assignee_name,
+            ),
+            self.notion_service.record_audit_log(
+                task_page_id=task.notion_page_id,
+                event_type="再依頼",
+                # タイムゾーン付きでもオフセットを出さず、従来どおり「YYYY-MM-DD HH:MM」で記録する
+                detail=(
+                    "タスクを修正して再送信\n納期: "
+                    + dto.due_date.replace(tzinfo=None).isoformat(sep=" ", timespec="minutes")
+                ),
+                actor_email=requester_email,
+            ),
+            return_exceptions=True,
+        )
+        self._log_side_effect_failure("metrics sync", metrics_result)
+        self._log_side_effect_failure("audit log", audit_result)
+        if isinstance(send_result, BaseException):
+            raise send_result
+
+        return self._to_response_dto(updated_task)
+
+    @staticmethod
+    def _extract_name(user_info: Dict[str, Any]) -> str:
+        """users.info の結果から表示名を取得（real_name > profile.real_name）"""
+        return user_info.get("real_name") or (user_info.get("profile") or {}).get("real_name", "Unknown")
+
+    @staticmethod
+    def _extract_email(user_info: Dict[str, Any]) -> Optional[str]:
+        """users.info の結果からメールアドレスを取得"""
+        return (user_info.get("profile") or {}).get("email")
+
+    @staticmethod
+    def _log_side_effect_failure(label: str, result: object) -> None:
+        """並行実行した付随処理の例外をログに残す（本処理は継続する）"""
+        if isinstance(result, BaseException):
+            logger.warning("⚠️ Failed to run %s: %s", label, result)
+
+    async def _send_approval_request_with_thread(
+        self,
+        *,
+        task: TaskRequest,
+        requester_name: str,
+        assignee_name: str,
+    ) -> None:
+        """依頼先と依頼者の両方にDMで親メッセージを送信し、スレッド情報をNotionに保存"""
         thread_info = await self.slack_service.send_approval_request(
-            assignee_slack_id=dto.assignee_slack_id,
+            assignee_slack_id=task.assignee_slack_id,
             requester_slack_id=task.requester_slack_id,
-            task=updated_task,
+            task=task,
             requester_name=requester_name,
             assignee_name=assignee_name,
         )
 
-        # スレッド情報をNotionに保存
         if thread_info and task.notion_page_id:
             await self.notion_service.save_thread_info(
                 page_id=task.notion_page_id,
@@ -177,17 +240,6 @@ class TaskApplicationService:
                 requester_thread_channel=thread_info.get("requester_thread_channel"),
             )
 
-        await self.notion_service.record_audit_log(
-            task_page_id=task.notion_page_id,
-            event_type="再依頼",
-            detail=f"タスクを修正して再送信\n納期: {dto.due_date.strftime('%Y-%m-%d %H:%M')}",
-            actor_email=requester_email,
-        )
-
-        await self._sync_metrics(task.notion_page_id)
-
-        return self._to_response_dto(updated_task)
-
     async def handle_task_approval(self, dto: TaskApprovalDto) -> TaskResponseDto:
         """タスクの承認/差し戻しを処理"""
         # タスクを取得
@@ -195,33 +247,50 @@ class TaskApplicationService:
         if not task:
             raise ValueError(f"Task not found: {dto.task_id}")
 
+        # ユーザー情報とスレッド情報（Notionから）は読み取りのみのため、ロックの外で並行して取得
+        # Slackのusers.infoとNotionのページ取得はいずれもスレッドで実行されるため、実際に重なる
+        assignee_info, requester_info, snapshot = await asyncio.gather(
+            self.slack_service.get_user_info(task.assignee_slack_id),
+            self.slack_service.get_user_info(task.requester_slack_id),
+            self._get_task_snapshot(task.notion_page_id),
+        )
+
         lock_key = task.notion_page_id or task.id
 
+        # ロックはステータス遷移と書き込み処理の間だけ保持する
         async with self.concurrency.guard(lock_key):
-            return await self._handle_task_approval_locked(task, dto)
+            return await self._handle_task_approval_locked(
+                task,
+                dto,
+                assignee_info=assignee_info,
+                requester_info=requester_info,
+                snapshot=snapshot,
+            )
 
-    async def _handle_task_approval_locked(self, task: TaskRequest, dto: TaskApprovalDto) -> TaskResponseDto:
-        
-        # ユーザー情報を取得
-        assignee_info = await self.slack_service.get_user_info(task.assignee_slack_id)
-        requester_info = await self.slack_service.get_user_info(task.requester_slack_id)
-        assignee_name = assignee_info.get("real_name") or assignee_info.get("profile", {}).get("real_name", "Unknown")
-        requester_name = requester_info.get("real_name") or requester_info.get("profile", {}).get("real_name", "Unknown")
+    async def _handle_task_approval_locked(
+        self,
+        task: TaskRequest,
+        dto: TaskApprovalDto,
+        *,
+        assignee_info: Dict[str, Any],
+        requester_info: Dict[str, Any],
+        snapshot: Optional[NotionTaskSnapshot],
+    ) -> TaskResponseDto:
+        assignee_name = self._extract_name(assignee_info)
+        requester_name = self._extract_name(requester_info)
 
-        # スレッド情報を取得（Notionから）
         assignee_thread_ts = None
         assignee_thread_channel = None
         requester_thread_ts = None
         requester_thread_channel = None
-        if task.notion_page_id:
-            snapshot = await self.notion_service.get_task_snapshot(task.notion_page_id)
-            if snapshot:
-                assignee_thread_ts = snapshot.assignee_thread_ts
-                assignee_thread_channel = snapshot.assignee_thread_channel
-                requester_thread_ts = snapshot.requester_thread_ts
-                requester_thread_channel = snapshot.requester_thread_channel
+        if snapshot:
+            assignee_thread_ts = snapshot.assignee_thread_ts
+            assignee_thread_channel = snapshot.assignee_thread_channel
+            requester_thread_ts = snapshot.requester_thread_ts
+            requester_thread_channel = snapshot.requester_thread_channel
 
         # 承認または差し戻し
+        # Notionのステータス更新を先に単独で完了させ、失敗時はSlackへ何も反映しない
         if dto.action == "approve":
             task.approve()
 
@@ -232,38 +301,35 @@ class TaskApplicationService:
                     status=task.status.value,
                 )
 
-            # 親メッセージを更新（進行中ステータスに）
-            await self.slack_service.update_parent_messages(
-                task=task,
-                assignee_slack_id=task.assignee_slack_id,
-                requester_slack_id=task.requester_slack_id,
-                assignee_name=assignee_name,
-                requester_name=requester_name,
-                assignee_thread_ts=assignee_thread_ts,
-                assignee_thread_channel=assignee_thread_channel,
-                requester_thread_ts=requester_thread_ts,
-                requester_thread_channel=requester_thread_channel,
-                new_status="進行中",
-            )
-
-            # 依頼者に承認通知（スレッド返信として送信）
-            await self.slack_service.notify_approval(
-                requester_slack_id=task.requester_slack_id,
-                task=task,
-                thread_ts=requester_thread_ts,
-                thread_channel=requester_thread_channel,
+            # 親メッセージの更新（進行中ステータスに）と依頼者への承認通知（スレッド返信）
+            # どちらもSlackクライアントをスレッドで呼び出すため並行して実行する
+            await self._gather_slack_updates(
+                self.slack_service.update_parent_messages(
+                    task=task,
+                    assignee_slack_id=task.assignee_slack_id,
+                    requester_slack_id=task.requester_slack_id,
+                    assignee_name=assignee_name,
+                    requester_name=requester_name,
+                    assignee_thread_ts=assignee_thread_ts,
+                    assignee_thread_channel=assignee_thread_channel,
+                    requester_thread_ts=requester_thread_ts,
+                    requester_thread_channel=requester_thread_channel,
+                    new_status="進行中",
+                ),
+                self.slack_service.notify_approval(
+                    requester_slack_id=task.requester_slack_id,
+                    task=task,
+                    thread_ts=requester_thread_ts,
+                    thread_channel=requester_thread_channel,
+                ),
             )
 
             if self.task_event_notification_service:
-                try:
-                    await self.task_event_notification_service.notify_task_approved(
-                        task=task,
-                        approval_time=task.updated_at,
-                        requester_name=requester_name,
-                        assignee_name=assignee_name,
-                    )
-                except Exception as notify_error:
-                    print(f"⚠️ Failed to broadcast task approval notification: {notify_error}")
+                await self._notify_task_approved(
+                    task=task,
+                    requester_name=requester_name,
+                    assignee_name=assignee_name,
+                )
 
         elif dto.action == "reject":
             if not dto.rejection_reason:
@@ -279,26 +345,26 @@ class TaskApplicationService:
                     rejection_reason=dto.rejection_reason,
                 )
 
-            # 親メッセージを更新（差し戻しステータスに）
-            await self.slack_service.update_parent_messages(
-                task=task,
-                assignee_slack_id=task.assignee_slack_id,
-                requester_slack_id=task.requester_slack_id,
-                assignee_name=assignee_name,
-                requester_name=requester_name,
-                assignee_thread_ts=assignee_thread_ts,
-                assignee_thread_channel=assignee_thread_channel,
-                requester_thread_ts=requester_thread_ts,
-                requester_thread_channel=requester_thread_channel,
-                new_status="差し戻し",
-            )
-
-            # 依頼者に差し戻し通知（スレッド返信として送信）
-            await self.slack_service.notify_rejection(
-                requester_slack_id=task.requester_slack_id,
-                task=task,
-                thread_ts=requester_thread_ts,
-                thread_channel=requester_thread_channel,
+            # 親メッセージの更新（差し戻しステータスに）と依頼者への差し戻し通知（スレッド返信）
+            await self._gather_slack_updates(
+                self.slack_service.update_parent_messages(
+                    task=task,
+                    assignee_slack_id=task.assignee_slack_id,
+                    requester_slack_id=task.requester_slack_id,
+                    assignee_name=assignee_name,
+                    requester_name=requester_name,
+                    assignee_thread_ts=assignee_thread_ts,
+                    assignee_thread_channel=assignee_thread_channel,
+                    requester_thread_ts=requester_thread_ts,
+                    requester_thread_channel=requester_thread_channel,
+                    new_status="差し戻し",
+                ),
+                self.slack_service.notify_rejection(
+                    requester_slack_id=task.requester_slack_id,
+                    task=task,
+                    thread_ts=requester_thread_ts,
+                    thread_channel=requester_thread_channel,
+                ),
             )
         else:
             raise ValueError(f"Invalid action: {dto.action}")
@@ -306,33 +372,65 @@ class TaskApplicationService:
         # タスクを更新
         updated_task = await self.task_repository.update(task)
 
-        await self._sync_metrics(task.notion_page_id)
+        # 取得済みのスナップショットに更新後のステータスを反映して渡し、再取得を省く
+        if snapshot:
+            snapshot = replace(snapshot, status=task_status_name(task.status.value))
+        await self._sync_metrics(task.notion_page_id, snapshot)
 
         return self._to_response_dto(updated_task)
 
-    async def _sync_metrics(self, notion_page_id: Optional[str]) -> None:
-        if not notion_page_id or not self.task_metrics_service:
+    @staticmethod
+    async def _gather_slack_updates(*updates: Awaitable[Any]) -> None:
+        """Slackへの反映を並行して実行し、すべて終わってから最初の例外を送出する"""
+        results = await asyncio.gather(*updates, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _get_task_snapshot(self, notion_page_id: Optional[str]) -> Optional[NotionTaskSnapshot]:
+        if not notion_page_id:
+            return None
+        return await self.notion_service.get_task_snapshot(notion_page_id)
+
+    async def _notify_task_approved(
+        self,
+        *,
+        task: TaskRequest,
+        requester_name: str,
+        assignee_name: str,
+    ) -> None:
+        """監視者へのタスク承認通知（失敗しても承認処理は継続する）"""
+        try:
+            await self.task_event_notification_service.notify_task_approved(
+                task=task,
+                approval_time=task.updated_at,
+                requester_name=requester_name,
+                assignee_name=assignee_name,
+            )
+        except Exception as notify_error:
+            logger.warning("⚠️ Failed to broadcast task approval notification: %s", notify_error)
+
+    async def _sync_metrics(
+        self,
+        notion_page_id: Optional[str],
+        snapshot: Optional[NotionTaskSnapshot] = None,
+    ) -> None:
+        # メトリクス無効時はスナップショット取得（Notion API呼び出し）自体を省く
+        if not notion_page_id or not self.task_metrics_service or not self.task_metrics_service.enabled:
             return
 
-        snapshot = await self.notion_service.get_task_snapshot(notion_page_id)
+        if snapshot is None:
+            snapshot = await self.notion_service.get_task_snapshot(notion_page_id)
         if snapshot:
             await self.task_metrics_service.sync_snapshot(snapshot)
-            await self.task_metrics_service.refresh_assignee_summaries()
+            self.task_metrics_service.schedule_assignee_summary_refresh()
 
-    def _to_response_dto(self, task: TaskRequest) -> TaskResponseDto:
-        """タスクエンティティをレスポンスDTOに変換"""
-        return TaskResponseDto(
-            id=task.id,
-            requester_slack_id=task.requester_slack_id,
-            assignee_slack_id=task.assignee_slack_id,
-            title=task.title,
-            description=task.description,
-            due_date=task.due_date,
-            task_type=task.task_type,
-            urgency=task.urgency,
-            status=task.status.value,
-            rejection_reason=task.rejection_reason,
-            created_at=task.created_at,
-            updated_at=task.updated_at,
-            notion_page_id=task.notion_page_id,
-        )
+    @staticmethod
+    def _to_response_dto(task: TaskRequest) -> TaskResponseDto:
+        """タスクエンティティをレスポンスDTOに変換
+
+        エンティティの各フィールドは型が保証されているため、検証を省いて構築する。
+        """
+        values = dict(zip(_RESPONSE_FIELDS, _get_response_values(task)))
+        values["status"] = _STATUS_TO_DTO[task.status]
+        return TaskResponseDto.model_construct(**values)
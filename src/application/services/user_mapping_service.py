@@ -1,16 +1,23 @@
-from typing import Optional
+import time
+from typing import Dict, Optional, Sequence, Tuple
 from src.domain.entities.user_mapping import UserMapping
 from src.domain.entities.slack_user import SlackUser
 from src.domain.entities.notion_user import NotionUser
 from src.domain.repositories.notion_user_repository import NotionUserRepositoryInterface
 from src.domain.repositories.slack_user_repository import SlackUserRepositoryInterface
 from src.domain.services.user_mapping_domain_service import UserMappingDomainService
-from src.domain.value_objects.email import Email
+from src.domain.value_objects.email import Email, cached_email
 from src.domain.value_objects.slack_user_id import SlackUserId
+from src.utils.concurrency import ConcurrencyCoordinator
 import logging
 
 logger = logging.getLogger(__name__)
 
+# メール→Notionユーザー検索結果のキャッシュ有効期間（秒）
+NOTION_USER_CACHE_TTL_SECONDS = 600.0
+# 見つからなかった結果は短めに保持し、追加されたユーザーへ早めに追従する
+NOTION_USER_MISS_TTL_SECONDS = 60.0
+
 
 class UserMappingApplicationService:
     """ユーザーマッピングのアプリケーションサービス"""
@@ -24,25 +31,83 @@ class UserMappingApplicationService:
         self.notion_user_repository = notion_user_repository
         self.slack_user_repository = slack_user_repository
         self.mapping_domain_service = mapping_domain_service
+        # メール（小文字）-> (有効期限のmonotonic時刻, NotionUser or None)
+        self._notion_user_cache: Dict[str, Tuple[float, Optional[NotionUser]]] = {}
+        # 同じメールへの同時検索を1回にまとめるためのメール単位のロック
+        self._notion_user_guard = ConcurrencyCoordinator()
 
     async def find_notion_user_by_email(self, email: str) -> Optional[NotionUser]:
-        """メールアドレスからNotionユーザーを動的検索"""
-        try:
-            email_vo = Email(email)
-            logger.info(f"🔍 Notion ユーザー検索: {email}")
-            
-            notion_user = await self.notion_user_repository.find_by_email(email_vo)
-            
-            if notion_user:
-                logger.info(f"✅ Notion ユーザー発見: {notion_user.display_name()} ({email})")
+        """メールアドレスからNotionユーザーを動的検索（結果はTTL付きでキャッシュ）"""
+        key = email.lower()
+        cached = self._notion_user_cache.get(key)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+
+        async with self._notion_user_guard.guard(key):
+            cached = self._notion_user_cache.get(key)
+            if cached and time.monotonic() < cached[0]:
+                return cached[1]
+
+            try:
+                email_vo = cached_email(email)
+                logger.info("🔍 Notion ユーザー検索: %s", email)
+
+                notion_user = await self.notion_user_repository.find_by_email(email_vo)
+
+                if notion_user:
+                    logger.info("✅ Notion ユーザー発見: %s (%s)", notion_user.display_name(), email)
+                    ttl = NOTION_USER_CACHE_TTL_SECONDS
+                else:
+                    logger.warning("❌ Notion ユーザー未発見: %s", email)
+                    ttl = NOTION_USER_MISS_TTL_SECONDS
+                self._notion_user_cache[key] = (time.monotonic() + ttl, notion_user)
                 return notion_user
-            else:
-                logger.warning(f"❌ Notion ユーザー未発見: {email}")
+
+            except ValueError as e:
+                logger.error("❌ 無効なメールアドレス %s: %s", email, e)
                 return None
-                
-        except ValueError as e:
-            logger.error(f"❌ 無効なメールアドレス {email}: {e}")
-            return None
+
+    async def find_notion_users_by_emails(
+        self,
+        emails: Sequence[str],
+    ) -> Dict[str, Optional[NotionUser]]:
+        """複数のメールアドレスからNotionユーザーをまとめて検索（キーは小文字のメール）
+
+        キャッシュにないメールだけをリポジトリの一括検索で解決し、結果は1件ずつの検索と同じTTLでキャッシュする。
+        """
+        results: Dict[str, Optional[NotionUser]] = {}
+        missing: Dict[str, Email] = {}
+        now = time.monotonic()
+        for email in emails:
+            key = email.lower()
+            if key in results or key in missing:
+                continue
+            cached = self._notion_user_cache.get(key)
+            if cached and now < cached[0]:
+                results[key] = cached[1]
+                continue
+            try:
+                missing[key] = cached_email(email)
+            except ValueError as e:
+                logger.error("❌ 無効なメールアドレス %s: %s", email, e)
+                results[key] = None
+
+        if not missing:
+            return results
+
+        logger.info("🔍 Notion ユーザー一括検索: %d件", len(missing))
+        found = await self.notion_user_repository.find_by_emails(list(missing.values()))
+        for key, email_vo in missing.items():
+            notion_user = found.get(email_vo)
+            if notion_user:
+                logger.info("✅ Notion ユーザー発見: %s (%s)", notion_user.display_name(), email_vo)
+                ttl = NOTION_USER_CACHE_TTL_SECONDS
+            else:
+                logger.warning("❌ Notion ユーザー未発見: %s", email_vo)
+                ttl = NOTION_USER_MISS_TTL_SECONDS
+            self._notion_user_cache[key] = (time.monotonic() + ttl, notion_user)
+            results[key] = notion_user
+        return results
 
     async def create_user_mapping(
         self, 
@@ -54,13 +119,13 @@ class UserMappingApplicationService:
             # Slackユーザー情報を取得
             slack_user = await self.slack_user_repository.get_user_info(slack_user_id)
             if not slack_user:
-                logger.error(f"❌ Slack ユーザー未発見: {slack_user_id}")
+                logger.error("❌ Slack ユーザー未発見: %s", slack_user_id)
                 return None
 
             # Notionユーザー情報を検索
             notion_user = await self.find_notion_user_by_email(requester_email)
             if not notion_user:
-                logger.error(f"❌ Notion ユーザー未発見: {requester_email}")
+                logger.error("❌ Notion ユーザー未発見: %s", requester_email)
                 return None
 
             # ドメインサービスでマッピング作成
@@ -70,14 +135,15 @@ class UserMappingApplicationService:
             )
 
             if mapping:
-                logger.info(f"✅ マッピング作成成功: {mapping.to_dict()}")
+                # 辞書化はログ出力時にのみ行われる（UserMapping.__str__）
+                logger.info("✅ マッピング作成成功: %s", mapping)
                 return mapping
             else:
-                logger.warning(f"❌ マッピング作成失敗: confidence不足")
+                logger.warning("❌ マッピング作成失敗: confidence不足")
                 return None
 
         except Exception as e:
-            logger.error(f"❌ マッピング作成エラー: {e}")
+            logger.error("❌ マッピング作成エラー: %s", e)
             return None
 
     async def get_notion_user_for_task_creation(
@@ -86,22 +152,21 @@ class UserMappingApplicationService:
         assignee_email: str
     ) -> tuple[Optional[NotionUser], Optional[NotionUser]]:
         """タスク作成用にNotionユーザーを取得"""
-        logger.info(f"📝 タスク作成用ユーザー検索: {requester_email}, {assignee_email}")
+        logger.info("📝 タスク作成用ユーザー検索: %s, %s", requester_email, assignee_email)
 
-        # 依頼者のNotionユーザー検索
-        requester = await self.find_notion_user_by_email(requester_email)
-        
-        # 依頼先のNotionユーザー検索
-        assignee = await self.find_notion_user_by_email(assignee_email)
+        # 依頼者・依頼先はまとめて検索する（自分宛てのタスクは1件として扱われる）
+        users = await self.find_notion_users_by_emails([requester_email, assignee_email])
+        requester = users.get(requester_email.lower())
+        assignee = users.get(assignee_email.lower())
 
         if requester and assignee:
-            logger.info(f"✅ 両ユーザー発見完了")
+            logger.info("✅ 両ユーザー発見完了")
         elif requester:
-            logger.warning(f"⚠️ 依頼先ユーザーが見つかりません: {assignee_email}")
+            logger.warning("⚠️ 依頼先ユーザーが見つかりません: %s", assignee_email)
         elif assignee:
-            logger.warning(f"⚠️ 依頼者ユーザーが見つかりません: {requester_email}")
+            logger.warning("⚠️ 依頼者ユーザーが見つかりません: %s", requester_email)
         else:
-            logger.error(f"❌ 両ユーザーが見つかりません")
+            logger.error("❌ 両ユーザーが見つかりません")
 
         return requester, assignee
 
@@ -3,7 +3,7 @@ from typing import Optional
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class CalendarTask:
     """カレンダータスクエンティティ
 
@@ -1,11 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 from datetime import datetime
 from src.domain.value_objects.email import Email
 from src.domain.value_objects.notion_user_id import NotionUserId
 
 
-@dataclass
+@dataclass(slots=True)
 class NotionUser:
     """Notionユーザーエンティティ"""
     user_id: NotionUserId
@@ -14,7 +14,7 @@ class NotionUser:
     user_type: str  # 'person' or 'bot'
     object_type: str  # 'user'
     avatar_url: Optional[str] = None
-    discovered_at: datetime = datetime.now()
+    discovered_at: datetime = field(default_factory=datetime.now)
 
     def is_guest_user(self) -> bool:
         """ゲストユーザーかどうか判定"""
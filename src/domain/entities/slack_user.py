@@ -4,7 +4,7 @@ from src.domain.value_objects.email import Email
 from src.domain.value_objects.slack_user_id import SlackUserId
 
 
-@dataclass
+@dataclass(slots=True)
 class SlackUser:
     """Slackユーザーエンティティ"""
     user_id: SlackUserId
@@ -11,7 +11,7 @@ class TaskStatus(Enum):
     REJECTED = "rejected"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskRequest:
     """タスク依頼エンティティ"""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
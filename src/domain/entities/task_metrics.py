@@ -4,9 +4,14 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional
 
+COMPLETION_APPROVED_LABELS = frozenset({"完了承認", "完了"})
+STATUS_COMPLETED_LABELS = frozenset({"完了"})
 
-@dataclass(slots=True)
+
+@dataclass(frozen=True, slots=True)
 class TaskMetricsRecord:
+    """タスクごとのメトリクス（不変。値を変える場合は dataclasses.replace で作り直す）"""
+
     task_page_id: str
     task_title: str
     assignee_email: Optional[str]
@@ -20,6 +25,31 @@ class TaskMetricsRecord:
     extension_status: Optional[str] = None
     metrics_page_id: Optional[str] = None
     last_synced_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # 集計用の派生値（担当者・status・completion_status・due_date から生成時に1回だけ計算する）
+    # レコードは不変のため、元の値と食い違うことはない
+    assignee_key: str = field(init=False, default="", repr=False, compare=False)
+    is_completed: bool = field(init=False, default=False, repr=False, compare=False)
+    due_date_utc: Optional[datetime] = field(init=False, default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "assignee_key",
+            self.assignee_email or self.assignee_notion_id or "__unassigned__",
+        )
+        object.__setattr__(
+            self,
+            "is_completed",
+            (self.status or "").strip() in STATUS_COMPLETED_LABELS
+            or (self.completion_status or "").strip() in COMPLETION_APPROVED_LABELS,
+        )
+        due_date = self.due_date
+        if due_date is not None:
+            if due_date.tzinfo is None:
+                due_date = due_date.replace(tzinfo=timezone.utc)
+            else:
+                due_date = due_date.astimezone(timezone.utc)
+        object.__setattr__(self, "due_date_utc", due_date)
 
 
 @dataclass(slots=True)
@@ -6,7 +6,7 @@ from src.domain.entities.slack_user import SlackUser
 from src.domain.value_objects.email import Email
 
 
-@dataclass
+@dataclass(slots=True)
 class UserMapping:
     """SlackユーザーとNotionユーザーのマッピングエンティティ"""
     slack_user: SlackUser
@@ -74,4 +74,8 @@ class UserMapping:
             'confidence': self.confidence,
             'source': self.mapping_source,
             'mapped_at': self.mapped_at.isoformat()
-        }
\ No newline at end of file
+        }
+
+    def __str__(self) -> str:
+        """ログ用の文字列表現（%s で遅延フォーマットされ、出力されない場合は辞書を作らない）"""
+        return str(self.to_dict())
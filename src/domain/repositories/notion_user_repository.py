@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from src.domain.entities.notion_user import NotionUser
 from src.domain.value_objects.email import Email
 from src.domain.value_objects.notion_user_id import NotionUserId
@@ -18,6 +18,11 @@ class NotionUserRepositoryInterface(ABC):
         """ユーザーIDでユーザーを取得"""
         pass
 
+    @abstractmethod
+    async def find_by_emails(self, emails: List[Email]) -> Dict[Email, NotionUser]:
+        """複数のメールアドレスでユーザーをまとめて検索（見つかったものだけを返す）"""
+        pass
+
     @abstractmethod
     async def search_users_in_database(
         self, 
@@ -37,6 +42,11 @@ class NotionUserRepositoryInterface(ABC):
         """ワークスペースの全正規ユーザーを取得（users.list()）"""
         pass
 
+    @abstractmethod
+    async def prefetch_workspace(self, ttl_seconds: Optional[float] = None) -> None:
+        """ワークスペースの全正規ユーザーを先読みし、メール索引としてキャッシュ"""
+        pass
+
     @abstractmethod
     async def get_users_from_database_properties(
         self, 
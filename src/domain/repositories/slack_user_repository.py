@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, List, Optional
 from src.domain.entities.slack_user import SlackUser
 from src.domain.value_objects.email import Email
 from src.domain.value_objects.slack_user_id import SlackUserId
@@ -18,6 +18,11 @@ class SlackUserRepositoryInterface(ABC):
         """メールアドレスでユーザーを検索"""
         pass
 
+    @abstractmethod
+    async def find_by_emails(self, emails: List[Email]) -> Dict[Email, SlackUser]:
+        """複数のメールアドレスでユーザーをまとめて検索（見つかったものだけを返す）"""
+        pass
+
     @abstractmethod
     async def get_user_info(self, user_id: str) -> Optional[SlackUser]:
         """ユーザー情報を取得（文字列IDから）"""
@@ -6,9 +6,6 @@ from typing import Iterable, List, Optional
 
 from src.domain.entities.task_metrics import AssigneeMetricsSummary, TaskMetricsRecord
 
-_COMPLETION_APPROVED_LABELS = {"完了承認", "完了"}
-_STATUS_COMPLETED_LABELS = {"完了"}
-
 
 def _normalize_reference_time(reference_time: Optional[datetime]) -> datetime:
     if reference_time is None:
@@ -28,11 +25,12 @@ class TaskMetricsDomainService:
     ) -> List[AssigneeMetricsSummary]:
         ref_time = _normalize_reference_time(reference_time)
         due_soon_threshold = ref_time + timedelta(days=3)
+        # 1回の集計で作るサマリーは同じ集計日時を共有する
+        calculated_at = datetime.now(timezone.utc)
 
         grouped: dict[str, list[TaskMetricsRecord]] = defaultdict(list)
         for record in metrics_records:
-            key = record.assignee_email or record.assignee_notion_id or "__unassigned__"
-            grouped[key].append(record)
+            grouped[record.assignee_key].append(record)
 
         summaries: List[AssigneeMetricsSummary] = []
         for records in grouped.values():
@@ -43,33 +41,23 @@ class TaskMetricsDomainService:
             assignee_notion_id = records[0].assignee_notion_id
             assignee_name = records[0].assignee_name
 
-            overdue_tasks = 0
-            due_within_three_days = 0
-            next_due_candidate: Optional[datetime] = None
-            total_overdue_points = 0
-            completed_count = 0
-            open_count = 0
-
-            for record in records:
-                total_overdue_points += max(record.overdue_points, 0)
-
-                due_date = record.due_date
-                completed = self._is_completed(record)
-                if completed:
-                    completed_count += 1
-                else:
-                    open_count += 1
-
-                if due_date:
-                    due_date = self._ensure_timezone(due_date)
-                    if not completed:
-                        if due_date < ref_time:
-                            overdue_tasks += 1
-                        if ref_time <= due_date <= due_soon_threshold:
-                            due_within_three_days += 1
-                        if due_date >= ref_time:
-                            if next_due_candidate is None or due_date < next_due_candidate:
-                                next_due_candidate = due_date
+            # 条件ごとに組み込み関数で集計する（Python側のループ本体と分岐を減らす）
+            completed_count = sum(1 for record in records if record.is_completed)
+            total_overdue_points = sum(
+                record.overdue_points for record in records if record.overdue_points > 0
+            )
+            open_due_dates = [
+                record.due_date_utc
+                for record in records
+                if not record.is_completed and record.due_date_utc
+            ]
+            upcoming_due_dates = [due_date for due_date in open_due_dates if due_date >= ref_time]
+            overdue_tasks = len(open_due_dates) - len(upcoming_due_dates)
+            due_within_three_days = sum(
+                1 for due_date in upcoming_due_dates if due_date <= due_soon_threshold
+            )
+            next_due_candidate = min(upcoming_due_dates, default=None)
+            open_count = len(records) - completed_count
 
             summaries.append(
                 AssigneeMetricsSummary(
@@ -83,24 +71,8 @@ class TaskMetricsDomainService:
                     due_within_three_days=due_within_three_days,
                     next_due_date=next_due_candidate,
                     total_overdue_points=total_overdue_points,
+                    last_calculated_at=calculated_at,
                 )
             )
 
         return summaries
-
-    @staticmethod
-    def _ensure_timezone(value: datetime) -> datetime:
-        if value.tzinfo is None:
-            return value.replace(tzinfo=timezone.utc)
-        return value.astimezone(timezone.utc)
-
-    @staticmethod
-    def _is_completed(record: TaskMetricsRecord) -> bool:
-        status = (record.status or "").strip()
-        completion_status = (record.completion_status or "").strip()
-
-        if status in _STATUS_COMPLETED_LABELS:
-            return True
-        if completion_status in _COMPLETION_APPROVED_LABELS:
-            return True
-        return False
@@ -1,8 +1,10 @@
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional
 from src.domain.entities.slack_user import SlackUser
 from src.domain.entities.notion_user import NotionUser
 from src.domain.entities.user_mapping import UserMapping
 from src.domain.value_objects.email import Email
+from src.domain.value_objects.slack_user_id import SlackUserId
 
 
 class UserMappingDomainService:
@@ -17,54 +19,66 @@ class UserMappingDomainService:
         if not notion_users:
             return None
 
-        # 1. メールアドレス完全一致（最優先）
-        exact_match = self._find_email_exact_match(slack_user, notion_users)
-        if exact_match:
-            return UserMapping.create_email_exact_mapping(slack_user, exact_match)
-
-        # 2. メールドメイン一致
-        domain_match = self._find_email_domain_match(slack_user, notion_users)
-        if domain_match:
-            return UserMapping.create_email_domain_mapping(slack_user, domain_match)
-
-        # 3. 名前の類似性による一致（将来的に実装可能）
-        # name_match = self._find_name_similarity_match(slack_user, notion_users)
-        
-        return None
+        # 単一ユーザーでも一括マッピングと同じ索引で照合する
+        return self._find_mapping_in_index(
+            slack_user,
+            self.build_email_index(notion_users),
+            self.build_domain_index(notion_users),
+        )
 
-    def _find_email_exact_match(
+    def find_best_mapping_bulk(
         self,
-        slack_user: SlackUser,
+        slack_users: List[SlackUser],
         notion_users: List[NotionUser]
-    ) -> Optional[NotionUser]:
-        """メールアドレス完全一致検索"""
-        slack_email_normalized = slack_user.email.normalized()
-        
+    ) -> Dict[SlackUserId, UserMapping]:
+        """複数のSlackユーザーをまとめてマッピング（索引を1回だけ作り、各ユーザーを索引で照合）"""
+        if not notion_users:
+            return {}
+
+        email_index = self.build_email_index(notion_users)
+        domain_index = self.build_domain_index(notion_users)
+
+        mappings: Dict[SlackUserId, UserMapping] = {}
+        for slack_user in slack_users:
+            mapping = self._find_mapping_in_index(slack_user, email_index, domain_index)
+            if mapping:
+                mappings[slack_user.user_id] = mapping
+        return mappings
+
+    @staticmethod
+    def build_email_index(notion_users: List[NotionUser]) -> Dict[str, NotionUser]:
+        """正規化メールアドレス → Notionユーザーの索引（重複時はリストの先頭を採用）"""
+        index: Dict[str, NotionUser] = {}
         for notion_user in notion_users:
-            if notion_user.email.normalized() == slack_email_normalized:
-                return notion_user
-        
-        return None
+            index.setdefault(notion_user.email.normalized().value, notion_user)
+        return index
 
-    def _find_email_domain_match(
-        self,
+    @staticmethod
+    def build_domain_index(notion_users: List[NotionUser]) -> Dict[str, List[NotionUser]]:
+        """メールドメイン → Notionユーザー一覧の索引"""
+        index: Dict[str, List[NotionUser]] = defaultdict(list)
+        for notion_user in notion_users:
+            index[notion_user.email.domain()].append(notion_user)
+        return index
+
+    @staticmethod
+    def _find_mapping_in_index(
         slack_user: SlackUser,
-        notion_users: List[NotionUser]
-    ) -> Optional[NotionUser]:
-        """メールドメイン一致検索"""
-        slack_domain = slack_user.email.domain()
-        
-        # 同一ドメインのNotionユーザーを検索
-        domain_matches = [
-            user for user in notion_users
-            if user.email.domain() == slack_domain
-        ]
-        
+        email_index: Dict[str, NotionUser],
+        domain_index: Dict[str, List[NotionUser]],
+    ) -> Optional[UserMapping]:
+        """索引からSlackユーザーに対応するマッピングを探す"""
+        # 1. メールアドレス完全一致（最優先）
+        exact_match = email_index.get(slack_user.email.normalized().value)
+        if exact_match:
+            return UserMapping.create_email_exact_mapping(slack_user, exact_match)
+
+        # 2. メールドメイン一致（ドメイン内で唯一の場合のみ。複数候補は手動確認が必要）
+        domain_matches = domain_index.get(slack_user.email.domain(), [])
         if len(domain_matches) == 1:
-            # ドメイン内で唯一の場合のみマッチング
-            return domain_matches[0]
-        
-        # 複数候補がある場合は手動確認が必要
+            return UserMapping.create_email_domain_mapping(slack_user, domain_matches[0])
+
+        # 3. 名前の類似性による一致（将来的に実装可能）
         return None
 
     def calculate_mapping_confidence(
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 import re
 from typing import TYPE_CHECKING
 
@@ -10,35 +11,57 @@ else:
     except ImportError:
         from typing_extensions import Self
 
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
-@dataclass(frozen=True)
+
+def _is_valid_email(email: str) -> bool:
+    """メールアドレス形式の妥当性チェック"""
+    return bool(email) and _EMAIL_PATTERN.match(email) is not None
+
+
+@dataclass(frozen=True, slots=True)
 class Email:
     """メールアドレスのバリューオブジェクト"""
     value: str
+    # 不変なので小文字化と分割は生成時に1回だけ行う（比較・ハッシュには含めない）
+    _lowered: str = field(init=False, repr=False, compare=False)
+    _local_part: str = field(init=False, repr=False, compare=False)
+    _domain: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        if not self._is_valid_email(self.value):
+        if not _is_valid_email(self.value):
             raise ValueError(f"Invalid email format: {self.value}")
-
-    def _is_valid_email(self, email: str) -> bool:
-        """メールアドレス形式の妥当性チェック"""
-        if not email:
-            return False
-        
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        local_part, _, domain = self.value.partition('@')
+        object.__setattr__(self, "_lowered", self.value.lower())
+        object.__setattr__(self, "_local_part", local_part)
+        object.__setattr__(self, "_domain", domain)
 
     def domain(self) -> str:
         """メールアドレスのドメイン部分を取得"""
-        return self.value.split('@')[1]
+        return self._domain
 
     def local_part(self) -> str:
         """メールアドレスのローカル部分を取得"""
-        return self.value.split('@')[0]
+        return self._local_part
 
     def normalized(self) -> Self:
         """正規化されたメールアドレス（小文字）"""
-        return Email(self.value.lower())
+        # 既に小文字なら自身を返す（frozenなので共有して安全）
+        if self._lowered == self.value:
+            return self
+        # 検証済みの値を小文字化しただけなので、形式チェックを省いて生成する
+        normalized = object.__new__(Email)
+        object.__setattr__(normalized, "value", self._lowered)
+        object.__setattr__(normalized, "_lowered", self._lowered)
+        object.__setattr__(normalized, "_local_part", self._local_part.lower())
+        object.__setattr__(normalized, "_domain", self._domain.lower())
+        return normalized
 
     def __str__(self) -> str:
-        return self.value
\ No newline at end of file
+        return self.value
+
+
+@lru_cache(maxsize=4096)
+def cached_email(value: str) -> Email:
+    """同じ文字列からのEmail生成を再利用する（不変なので共有して安全。不正な値は例外となりキャッシュされない）"""
+    return Email(value)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-import uuid
+import re
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -10,32 +10,27 @@ else:
     except ImportError:
         from typing_extensions import Self
 
+# NotionのIDはハイフンなし32桁、またはハイフン付き36桁（8-4-4-4-12）のUUID形式
+_NOTION_ID_PATTERN = re.compile(
+    r'[0-9a-fA-F]{32}'
+    r'|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+)
 
-@dataclass(frozen=True)
+
+def _is_valid_notion_id(notion_id: str) -> bool:
+    """Notion IDの形式チェック（例外を使わず正規表現1回で判定）"""
+    return bool(notion_id) and _NOTION_ID_PATTERN.fullmatch(notion_id) is not None
+
+
+@dataclass(frozen=True, slots=True)
 class NotionUserId:
     """NotionユーザーIDのバリューオブジェクト"""
     value: str
 
     def __post_init__(self):
-        if not self._is_valid_notion_id(self.value):
+        if not _is_valid_notion_id(self.value):
             raise ValueError(f"Invalid Notion user ID format: {self.value}")
 
-    def _is_valid_notion_id(self, notion_id: str) -> bool:
-        """Notion IDの形式チェック"""
-        if not notion_id:
-            return False
-        
-        # NotionのIDは通常32文字のハイフンなしUUID形式
-        if len(notion_id) == 32 and all(c.isalnum() or c in '-' for c in notion_id):
-            return True
-            
-        # または36文字のUUID形式
-        try:
-            uuid.UUID(notion_id)
-            return True
-        except ValueError:
-            return False
-
     def normalized(self) -> Self:
         """ハイフンなしの正規化されたID"""
         return NotionUserId(self.value.replace('-', ''))
@@ -1,4 +1,3 @@
-import os
 import json
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
@@ -41,12 +40,12 @@ class GoogleCalendarService:
                 raise ValueError(f"Invalid service account JSON: {e}")
         else:
             # ローカル環境：ファイルパスからJSONを読み込み
-            if not os.path.exists(service_account_json):
+            try:
+                with open(service_account_json, 'rb') as f:
+                    service_account_info = json.loads(f.read())
+            except FileNotFoundError:
                 raise FileNotFoundError(f"Service account file not found: {service_account_json}")
 
-            with open(service_account_json, 'r') as f:
-                service_account_info = json.load(f)
-
         return service_account.Credentials.from_service_account_info(
             service_account_info,
             scopes=self.SCOPES
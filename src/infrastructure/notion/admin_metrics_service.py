@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import time
+from dataclasses import replace
 from datetime import datetime, timezone
-from typing import Dict, Any, Iterable, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Sequence
 
 from notion_client import Client
 
 from src.domain.entities.task_metrics import AssigneeMetricsSummary, TaskMetricsRecord
+from src.infrastructure.notion.rate_limited_client import notion_executor
+from src.utils.concurrency import AsyncToThreadRunner
 
 
 METRICS_PROP_TASK_ID = "タスクID"
@@ -31,6 +35,15 @@ SUMMARY_PROP_NEXT_DUE = "最短納期"
 SUMMARY_PROP_TOTAL_OVERDUE_POINTS = "納期超過ポイント累計"
 SUMMARY_PROP_LAST_UPDATED = "最終更新"
 
+# DBスキーマのキャッシュ有効期間（秒）。スキーマ変更は稀だが、再起動なしで追従できるようにする
+SCHEMA_CACHE_TTL_SECONDS = 300.0
+
+# Notion APIのレート制限（約3リクエスト/秒）に合わせた同時実行数の上限
+NOTION_MAX_CONCURRENCY = 3
+
+# 複合フィルター1件あたりの条件数（Notion APIの上限100件以内）
+METRICS_BATCH_FILTER_SIZE = 50
+
 
 class AdminMetricsNotionService:
     """管理者向けのタスクメトリクスデータベースを扱うサービス"""
@@ -40,8 +53,9 @@ class AdminMetricsNotionService:
         notion_token: str,
         metrics_database_id: Optional[str],
         summary_database_id: Optional[str] = None,
+        client: Optional[Client] = None,
     ) -> None:
-        self.client = Client(auth=notion_token)
+        self.client = client or Client(auth=notion_token)
         self.metrics_database_id = (
             self._normalize_database_id(metrics_database_id)
             if metrics_database_id
@@ -53,6 +67,12 @@ class AdminMetricsNotionService:
             else None
         )
         self._summary_title_prop_name: Optional[str] = None
+        self._summary_title_prop_expires_at = 0.0
+        # 同期クライアントの呼び出しをNotion専用スレッドに逃がし、複数タスクの同期を並行させる
+        self._runner = AsyncToThreadRunner(
+            max_concurrency=NOTION_MAX_CONCURRENCY,
+            executor=notion_executor,
+        )
 
     @staticmethod
     def _normalize_database_id(database_id: str) -> str:
@@ -66,6 +86,8 @@ class AdminMetricsNotionService:
         results: List[TaskMetricsRecord] = []
         has_more = True
         start_cursor: Optional[str] = None
+        # 最終同期日時が未記録のページには、1回の読み込みで共通の時刻を使う
+        loaded_at = datetime.now(timezone.utc)
 
         while has_more:
             payload: Dict[str, Any] = {
@@ -75,9 +97,9 @@ class AdminMetricsNotionService:
             if start_cursor:
                 payload["start_cursor"] = start_cursor
 
-            response = self.client.databases.query(**payload)
+            response = await self._runner.run(self.client.databases.query, **payload)
             for page in response.get("results", []):
-                record = self._to_metrics_record(page)
+                record = self._to_metrics_record(page, loaded_at)
                 if record:
                     results.append(record)
 
@@ -91,7 +113,8 @@ class AdminMetricsNotionService:
         if not self.metrics_database_id:
             return None
 
-        response = self.client.databases.query(
+        response = await self._runner.run(
+            self.client.databases.query,
             database_id=self.metrics_database_id,
             page_size=1,
             filter={
@@ -104,24 +127,71 @@ class AdminMetricsNotionService:
             return None
         return self._to_metrics_record(results[0])
 
+    async def fetch_metrics_by_task_ids(
+        self,
+        task_page_ids: Sequence[str],
+    ) -> Dict[str, TaskMetricsRecord]:
+        """複数タスクのメトリクスをOR条件のクエリでまとめて取得"""
+        if not self.metrics_database_id or not task_page_ids:
+            return {}
+
+        unique_ids = list(dict.fromkeys(task_page_ids))
+        records: Dict[str, TaskMetricsRecord] = {}
+        loaded_at = datetime.now(timezone.utc)
+        for offset in range(0, len(unique_ids), METRICS_BATCH_FILTER_SIZE):
+            chunk = unique_ids[offset:offset + METRICS_BATCH_FILTER_SIZE]
+            payload: Dict[str, Any] = {
+                "database_id": self.metrics_database_id,
+                "page_size": 100,
+                "filter": {
+                    "or": [
+                        {
+                            "property": METRICS_PROP_TASK_ID,
+                            "rich_text": {"equals": task_page_id},
+                        }
+                        for task_page_id in chunk
+                    ]
+                },
+            }
+            while True:
+                response = await self._runner.run(self.client.databases.query, **payload)
+                for page in response.get("results", []):
+                    record = self._to_metrics_record(page, loaded_at)
+                    # 重複ページがある場合は get_metrics_by_task_id と同様に先頭を採用
+                    if record and record.task_page_id not in records:
+                        records[record.task_page_id] = record
+                next_cursor = response.get("next_cursor")
+                if not (response.get("has_more") and next_cursor):
+                    break
+                payload["start_cursor"] = next_cursor
+
+        return records
+
     async def upsert_task_metrics(self, record: TaskMetricsRecord) -> TaskMetricsRecord:
         if not self.metrics_database_id:
             return record
 
-        existing = await self.get_metrics_by_task_id(record.task_page_id)
+        # 呼び出し側で既存ページが判明している場合は再検索しない
+        metrics_page_id = record.metrics_page_id
+        if not metrics_page_id:
+            existing = await self.get_metrics_by_task_id(record.task_page_id)
+            metrics_page_id = existing.metrics_page_id if existing else None
         properties = self._build_task_metrics_properties(record)
 
-        if existing and existing.metrics_page_id:
-            self.client.pages.update(page_id=existing.metrics_page_id, properties=properties)
-            record.metrics_page_id = existing.metrics_page_id
-        else:
-            created = self.client.pages.create(
-                parent={"database_id": self.metrics_database_id},
+        if metrics_page_id:
+            await self._runner.run(
+                self.client.pages.update,
+                page_id=metrics_page_id,
                 properties=properties,
             )
-            record.metrics_page_id = created.get("id")
+            return replace(record, metrics_page_id=metrics_page_id)
 
-        return record
+        created = await self._runner.run(
+            self.client.pages.create,
+            parent={"database_id": self.metrics_database_id},
+            properties=properties,
+        )
+        return replace(record, metrics_page_id=created.get("id"))
 
     async def update_overdue_points(self, task_page_id: str, points: int) -> Optional[TaskMetricsRecord]:
         if not self.metrics_database_id:
@@ -132,18 +202,18 @@ class AdminMetricsNotionService:
             return None
 
         points_value = max(points, 0)
-        self.client.pages.update(
+        now_utc = datetime.now(timezone.utc)
+        await self._runner.run(
+            self.client.pages.update,
             page_id=record.metrics_page_id,
             properties={
                 METRICS_PROP_OVERDUE_POINTS: {"number": points_value},
                 METRICS_PROP_LAST_SYNCED: {
-                    "date": {"start": self._format_datetime(datetime.now(timezone.utc))}
+                    "date": {"start": self._format_datetime(now_utc)}
                 },
             },
         )
-        record.overdue_points = points_value
-        record.last_synced_at = datetime.now(timezone.utc)
-        return record
+        return replace(record, overdue_points=points_value, last_synced_at=now_utc)
 
     async def update_reminder_stage(
         self,
@@ -166,10 +236,10 @@ class AdminMetricsNotionService:
         if stage is not None:
             properties[METRICS_PROP_REMINDER_STAGE] = {"select": {"name": stage}}
 
-        self.client.pages.update(page_id=record.metrics_page_id, properties=properties)
-        record.reminder_stage = stage
-        record.last_synced_at = synced_at
-        return record
+        await self._runner.run(
+            self.client.pages.update, page_id=record.metrics_page_id, properties=properties
+        )
+        return replace(record, reminder_stage=stage, last_synced_at=synced_at)
 
     async def upsert_assignee_summaries(
         self,
@@ -184,61 +254,65 @@ class AdminMetricsNotionService:
 
         print(f"🧮 Building assignee summaries: {len(summary_items)} 件")
         for summary in summary_items:
-            existing = self._find_summary_by_email(summary.assignee_email)
-            if not existing and summary.assignee_notion_id:
-                existing = self._find_summary_by_person(summary.assignee_notion_id)
-            properties = self._build_summary_properties(summary)
-
-            if existing and existing.get("id"):
-                try:
-                    page_id = existing["id"]
-                    self.client.pages.update(page_id=page_id, properties=properties)
-                    print(
-                        f"🔁 Updated summary for: {summary.assignee_email or summary.assignee_notion_id or '(unassigned)'}"
-                        f" | page_id: {page_id}"
-                    )
-                except Exception as e:
-                    print(f"❌ Failed to update summary: {e}")
-            else:
+            # 検索・作成・更新は同期クライアントの連続呼び出しのため、1件ずつスレッドで実行する
+            await self._runner.run(self._upsert_assignee_summary, summary)
+
+    def _upsert_assignee_summary(self, summary: AssigneeMetricsSummary) -> None:
+        existing = self._find_summary_by_email(summary.assignee_email)
+        if not existing and summary.assignee_notion_id:
+            existing = self._find_summary_by_person(summary.assignee_notion_id)
+        properties = self._build_summary_properties(summary)
+
+        if existing and existing.get("id"):
+            try:
+                page_id = existing["id"]
+                self.client.pages.update(page_id=page_id, properties=properties)
+                print(
+                    f"🔁 Updated summary for: {summary.assignee_email or summary.assignee_notion_id or '(unassigned)'}"
+                    f" | page_id: {page_id}"
+                )
+            except Exception as e:
+                print(f"❌ Failed to update summary: {e}")
+        else:
+            try:
+                created = self.client.pages.create(
+                    parent={"database_id": self.summary_database_id},
+                    properties=properties,
+                )
+                page_id = created.get("id")
+                print(
+                    f"✅ Created summary for: {summary.assignee_email or summary.assignee_notion_id or '(unassigned)'}"
+                    f" | page_id: {page_id}"
+                )
+            except Exception as e:
+                print(f"❌ Failed to create summary: {e}")
+                # タイトル未設定等の可能性があるため、タイトルプロパティ名を推定して再試行
                 try:
-                    created = self.client.pages.create(
-                        parent={"database_id": self.summary_database_id},
-                        properties=properties,
-                    )
-                    page_id = created.get("id")
-                    print(
-                        f"✅ Created summary for: {summary.assignee_email or summary.assignee_notion_id or '(unassigned)'}"
-                        f" | page_id: {page_id}"
-                    )
-                except Exception as e:
-                    print(f"❌ Failed to create summary: {e}")
-                    # タイトル未設定等の可能性があるため、タイトルプロパティ名を推定して再試行
-                    try:
-                        title_prop = self._get_summary_title_prop_name()
-                        if title_prop and title_prop not in properties:
-                            title_content = (
-                                summary.assignee_name
-                                or summary.assignee_email
-                                or "(unassigned)"
-                            )
-                            properties[title_prop] = {
-                                "title": [
-                                    {
-                                        "type": "text",
-                                        "text": {"content": title_content[:1000]},
-                                    }
-                                ]
-                            }
-                            created2 = self.client.pages.create(
-                                parent={"database_id": self.summary_database_id},
-                                properties=properties,
-                            )
-                            print(
-                                f"✅ Retried and created summary with title for: {summary.assignee_email or summary.assignee_notion_id or '(unassigned)'}"
-                                f" | page_id: {created2.get('id')}"
-                            )
-                    except Exception as retry_error:
-                        print(f"❌ Retry failed to create summary: {retry_error}")
+                    title_prop = self._get_summary_title_prop_name()
+                    if title_prop and title_prop not in properties:
+                        title_content = (
+                            summary.assignee_name
+                            or summary.assignee_email
+                            or "(unassigned)"
+                        )
+                        properties[title_prop] = {
+                            "title": [
+                                {
+                                    "type": "text",
+                                    "text": {"content": title_content[:1000]},
+                                }
+                            ]
+                        }
+                        created2 = self.client.pages.create(
+                            parent={"database_id": self.summary_database_id},
+                            properties=properties,
+                        )
+                        print(
+                            f"✅ Retried and created summary with title for: {summary.assignee_email or summary.assignee_notion_id or '(unassigned)'}"
+                            f" | page_id: {created2.get('id')}"
+                        )
+                except Exception as retry_error:
+                    print(f"❌ Retry failed to create summary: {retry_error}")
 
     def _find_summary_by_email(self, assignee_email: Optional[str]) -> Optional[Dict[str, Any]]:
         if not self.summary_database_id or not assignee_email:
@@ -407,25 +481,33 @@ class AdminMetricsNotionService:
         return properties
 
     def _get_summary_title_prop_name(self) -> Optional[str]:
-        """Summary DBのタイトルプロパティ名を取得（キャッシュ）"""
+        """Summary DBのタイトルプロパティ名を取得（TTL付きキャッシュ）"""
         if not self.summary_database_id:
             return None
-        if self._summary_title_prop_name is not None:
+        now = time.monotonic()
+        if now < self._summary_title_prop_expires_at:
             return self._summary_title_prop_name
+
+        title_prop_name: Optional[str] = None
         try:
             db = self.client.databases.retrieve(database_id=self.summary_database_id)
             props = db.get("properties", {})
             for name, meta in props.items():
                 if meta.get("type") == "title":
-                    self._summary_title_prop_name = name
-                    return name
+                    title_prop_name = name
+                    break
         except Exception as e:
             print(f"⚠️ Could not retrieve summary DB schema: {e}")
-        # キャッシュにNoneを記録して以後スキップ
-        self._summary_title_prop_name = None
-        return None
+        # 見つからなかった場合もTTLの間はNoneをキャッシュして再取得を抑える
+        self._summary_title_prop_name = title_prop_name
+        self._summary_title_prop_expires_at = now + SCHEMA_CACHE_TTL_SECONDS
+        return title_prop_name
 
-    def _to_metrics_record(self, page: Dict[str, Any]) -> Optional[TaskMetricsRecord]:
+    def _to_metrics_record(
+        self,
+        page: Dict[str, Any],
+        loaded_at: Optional[datetime] = None,
+    ) -> Optional[TaskMetricsRecord]:
         properties = page.get("properties", {})
 
         task_title = self._extract_title(properties.get(METRICS_PROP_TASK_TITLE))
@@ -446,7 +528,7 @@ class AdminMetricsNotionService:
         overdue_points = self._extract_number(properties.get(METRICS_PROP_OVERDUE_POINTS))
         last_synced_at = self._parse_datetime(properties.get(METRICS_PROP_LAST_SYNCED, {}).get("date"))
 
-        record = TaskMetricsRecord(
+        return TaskMetricsRecord(
             task_page_id=task_page_id,
             task_title=task_title or "",
             assignee_email=assignee_email,
@@ -459,10 +541,8 @@ class AdminMetricsNotionService:
             completion_status=completion_status,
             extension_status=extension_status,
             metrics_page_id=page.get("id"),
+            last_synced_at=last_synced_at or loaded_at or datetime.now(timezone.utc),
         )
-        if last_synced_at:
-            record.last_synced_at = last_synced_at
-        return record
 
     @staticmethod
     def _extract_title(prop: Optional[Dict[str, Any]]) -> Optional[str]:
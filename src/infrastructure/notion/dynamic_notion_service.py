@@ -1,14 +1,17 @@
 import json
 import os
+import re
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Tuple, Union
 from notion_client import Client
 from src.domain.entities.task import TaskRequest
 from src.domain.entities.notion_user import NotionUser
 from src.application.services.user_mapping_service import UserMappingApplicationService
 from src.utils.text_converter import convert_rich_text_to_plain_text
+from src.infrastructure.notion.rate_limited_client import run_in_notion_thread
 
 
 REMINDER_STAGE_NOT_SENT = "未送信"
@@ -78,6 +81,26 @@ AUDIT_PROP_DETAIL = "詳細"
 AUDIT_PROP_ACTOR = "実施者"
 AUDIT_PROP_OCCURRED_AT = "日時"
 
+# Notionユーザー名キャッシュの有効期間（秒）
+USER_NAME_CACHE_TTL_SECONDS = 300.0
+
+# 見出し（# / ##）、番号付きリスト（1. ）、箇条書き（- ）の行頭パターン
+_MARKDOWN_SPECIAL_LINE_RE = re.compile(r"(?:#{1,2} |\d\. |- )")
+
+# TaskStatusの値 -> Notion上のステータス表示名
+_TASK_STATUS_NAMES = {
+    "pending": TASK_STATUS_PENDING,
+    "approved": TASK_STATUS_APPROVED,
+    "rejected": TASK_STATUS_REJECTED,
+    "completed": TASK_STATUS_COMPLETED,
+    "disabled": TASK_STATUS_DISABLED,
+}
+
+
+def task_status_name(status: str) -> str:
+    """TaskStatusの値からNotion上のステータス表示名を取得（不明な値は承認待ち）"""
+    return _TASK_STATUS_NAMES.get(status, TASK_STATUS_PENDING)
+
 
 @dataclass
 class NotionTaskSnapshot:
@@ -125,8 +148,9 @@ class DynamicNotionService:
         database_id: str,
         user_mapping_service: UserMappingApplicationService,
         audit_database_id: Optional[str] = None,
+        client: Optional[Client] = None,
     ):
-        self.client = Client(auth=notion_token)
+        self.client = client or Client(auth=notion_token)
         self.database_id = self._normalize_database_id(database_id)
         self.user_mapping_service = user_mapping_service
         self.audit_database_id = (
@@ -134,6 +158,8 @@ class DynamicNotionService:
             if audit_database_id
             else None
         )
+        # Notionユーザー名のキャッシュ: user_id -> (有効期限のmonotonic時刻, 名前)
+        self._user_name_cache: Dict[str, Tuple[float, str]] = {}
 
     def _normalize_database_id(self, database_id: str) -> str:
         """データベースIDを正規化（ハイフンを削除）"""
@@ -179,6 +205,14 @@ class DynamicNotionService:
                 texts.append(text)
         return "".join(texts) if texts else None
 
+    def _extract_title(self, properties: Dict[str, Any]) -> str:
+        """タイトルプロパティの先頭テキストを取得（見つからなければ空文字）"""
+        title_items = (properties.get(TASK_PROP_TITLE) or {}).get("title")
+        if not title_items:
+            return ""
+        first = title_items[0]
+        return first.get("plain_text") or first.get("text", {}).get("content", "")
+
     def _extract_people(self, prop: Optional[Dict[str, Any]]) -> tuple[Optional[str], Optional[str]]:
         """Return first person's (notion_user_id, email)"""
         if not prop:
@@ -392,20 +426,7 @@ class DynamicNotionService:
         """マークダウンの特殊行（見出し、リストなど）かどうかを判定"""
         if not line:
             return False
-
-        # 見出し
-        if line.startswith('# ') or line.startswith('## '):
-            return True
-
-        # 番号付きリスト
-        if len(line) > 2 and line[0].isdigit() and line[1:3].startswith('. '):
-            return True
-
-        # 箇条書きリスト
-        if line.startswith('- '):
-            return True
-
-        return False
+        return _MARKDOWN_SPECIAL_LINE_RE.match(line) is not None
 
     def _extract_text_from_slack_rich_text(self, slack_rich_text: Dict[str, Any]) -> str:
         """Slackリッチテキストからプレーンテキストを抽出"""
@@ -431,28 +452,16 @@ class DynamicNotionService:
             return False
 
         # マークダウンの特徴的なパターンをチェック
-        lines = text.split('\n')
         markdown_patterns = 0
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # 見出し
-            if line.startswith('## ') or line.startswith('# '):
-                markdown_patterns += 1
-
-            # 番号付きリスト
-            if len(line) > 2 and line[0].isdigit() and line[1:3].startswith('. '):
-                markdown_patterns += 1
-
-            # 箇条書きリスト
-            if line.startswith('- '):
+        for line in text.split('\n'):
+            if _MARKDOWN_SPECIAL_LINE_RE.match(line.strip()):
                 markdown_patterns += 1
+                # マークダウンパターンが2つ以上あればマークダウンテキストと判定
+                if markdown_patterns >= 2:
+                    return True
 
-        # マークダウンパターンが2つ以上あればマークダウンテキストと判定
-        return markdown_patterns >= 2
+        return False
 
     async def create_task(
         self,
@@ -668,7 +677,8 @@ class DynamicNotionService:
                 },
             ])
 
-            response = self.client.pages.create(
+            response = await run_in_notion_thread(
+                self.client.pages.create,
                 parent={"database_id": self.database_id},
                 properties=properties,
                 children=page_children,
@@ -722,14 +732,19 @@ class DynamicNotionService:
 
     def _get_status_name(self, status: str) -> str:
         """ステータスの表示名を取得"""
-        status_map = {
-            "pending": TASK_STATUS_PENDING,
-            "approved": TASK_STATUS_APPROVED,
-            "rejected": TASK_STATUS_REJECTED,
-            "completed": TASK_STATUS_COMPLETED,
-            "disabled": TASK_STATUS_DISABLED,
-        }
-        return status_map.get(status, TASK_STATUS_PENDING)
+        return task_status_name(status)
+
+    def _get_user_name(self, user_id: str) -> str:
+        """Notionユーザー名を取得（TTL付きキャッシュ。取得失敗時は例外を送出しキャッシュしない）"""
+        now = time.monotonic()
+        cached = self._user_name_cache.get(user_id)
+        if cached and now < cached[0]:
+            return cached[1]
+
+        user = self.client.users.retrieve(user_id=user_id)
+        name = user.get("name", "")
+        self._user_name_cache[user_id] = (now + USER_NAME_CACHE_TTL_SECONDS, name)
+        return name
 
     async def get_task_by_id(self, task_id: str) -> Optional[Dict[str, Any]]:
         """タスクIDでNotionページを取得
@@ -750,13 +765,11 @@ class DynamicNotionService:
         """
         try:
             # ページ情報を取得
-            page = self.client.pages.retrieve(page_id=task_id)
+            page = await run_in_notion_thread(self.client.pages.retrieve, page_id=task_id)
             properties = page.get("properties", {})
 
             # プロパティから情報を抽出
-            title = ""
-            if "タイトル" in properties and properties["タイトル"]["title"]:
-                title = properties["タイトル"]["title"][0]["text"]["content"]
+            title = self._extract_title(properties)
 
             due_date = None
             if "納期" in properties and properties["納期"].get("date"):
@@ -769,8 +782,7 @@ class DynamicNotionService:
                     # ユーザー情報を取得
                     user_id = people[0]["id"]
                     try:
-                        user = self.client.users.retrieve(user_id=user_id)
-                        requester_name = user.get("name", "")
+                        requester_name = await run_in_notion_thread(self._get_user_name, user_id)
                     except Exception:
                         requester_name = "不明"
 
@@ -781,8 +793,7 @@ class DynamicNotionService:
                     # ユーザー情報を取得
                     user_id = people[0]["id"]
                     try:
-                        user = self.client.users.retrieve(user_id=user_id)
-                        assignee_name = user.get("name", "")
+                        assignee_name = await run_in_notion_thread(self._get_user_name, user_id)
                     except Exception:
                         assignee_name = "不明"
 
@@ -791,7 +802,7 @@ class DynamicNotionService:
                 status = properties["ステータス"]["select"]["name"]
 
             # ページコンテンツを取得
-            content_blocks = self.client.blocks.children.list(block_id=task_id)
+            content_blocks = await run_in_notion_thread(self.client.blocks.children.list, block_id=task_id)
             content = ""
             for block in content_blocks.get("results", []):
                 if block["type"] == "paragraph" and block.get("paragraph", {}).get("rich_text"):
@@ -854,7 +865,7 @@ class DynamicNotionService:
             if start_cursor:
                 query_payload["start_cursor"] = start_cursor
             try:
-                response = self.client.databases.query(**query_payload)
+                response = await run_in_notion_thread(self.client.databases.query, **query_payload)
             except Exception as e:
                 if "multiple data sources" in str(e).lower():
                     print("❌ Notionデータベースは複数ソースの結合DBのため、APIでの検索ができません。")
@@ -921,7 +932,7 @@ class DynamicNotionService:
                 query_payload["start_cursor"] = start_cursor
 
             try:
-                response = self.client.databases.query(**query_payload)
+                response = await run_in_notion_thread(self.client.databases.query, **query_payload)
                 page_count = len(response.get("results", []))
                 print(f"✅ Notionクエリ成功: {page_count}件のタスクを取得")
             except Exception as e:
@@ -929,13 +940,17 @@ class DynamicNotionService:
                 print(f"   クエリペイロード: {query_payload}")
                 break
 
+            # ページ単位でまとめて出力（タスクごとのprintを避ける）
+            log_lines: List[str] = []
             for page in response.get("results", []):
                 try:
                     snapshot = self._to_snapshot(page)
                     results.append(snapshot)
-                    print(f"  ✓ タスク追加: {snapshot.title} (status={snapshot.status}, completion={snapshot.completion_status}, extension={snapshot.extension_status})")
+                    log_lines.append(f"  ✓ タスク追加: {snapshot.title} (status={snapshot.status}, completion={snapshot.completion_status}, extension={snapshot.extension_status})")
                 except Exception as exc:
-                    print(f"⚠️ Failed to parse pending approval task snapshot: {exc}")
+                    log_lines.append(f"⚠️ Failed to parse pending approval task snapshot: {exc}")
+            if log_lines:
+                print("\n".join(log_lines))
 
             has_more = response.get("has_more", False)
             start_cursor = response.get("next_cursor")
@@ -945,7 +960,7 @@ class DynamicNotionService:
 
     async def get_task_snapshot(self, page_id: str) -> Optional[NotionTaskSnapshot]:
         try:
-            page = self.client.pages.retrieve(page_id=page_id)
+            page = await run_in_notion_thread(self.client.pages.retrieve, page_id=page_id)
             return self._to_snapshot(page)
         except Exception as exc:
             print(f"⚠️ Failed to get Notion task snapshot: {exc}")
@@ -962,12 +977,14 @@ class DynamicNotionService:
             print("⚠️ Audit database ID is not configured; skipping log entry.")
             return None
 
+        # タイトルと発生日時で同じ時刻を使う（時計の読み取りは1回だけ）
+        now = datetime.now(JST)
         properties: Dict[str, Any] = {
             AUDIT_PROP_TITLE: {
                 "title": [
                     {
                         "text": {
-                            "content": f"{event_type} - {datetime.now(JST).strftime('%Y/%m/%d %H:%M')}"
+                            "content": f"{event_type} - {now.strftime('%Y/%m/%d %H:%M')}"
                         }
                     }
                 ]
@@ -988,7 +1005,7 @@ class DynamicNotionService:
             },
             AUDIT_PROP_OCCURRED_AT: {
                 "date": {
-                    "start": self._format_datetime(datetime.now(JST))
+                    "start": self._format_datetime(now)
                 }
             },
         }
@@ -1006,7 +1023,8 @@ class DynamicNotionService:
                 }
 
         try:
-            response = self.client.pages.create(
+            response = await run_in_notion_thread(
+                self.client.pages.create,
                 parent={"database_id": self.audit_database_id},
                 properties=properties,
             )
@@ -1028,7 +1046,7 @@ class DynamicNotionService:
         }
 
         try:
-            self.client.pages.update(page_id=page_id, properties=properties)
+            await run_in_notion_thread(self.client.pages.update, page_id=page_id, properties=properties)
         except Exception as exc:
             print(f"⚠️ Failed to update reminder state in Notion: {exc}")
 
@@ -1043,7 +1061,7 @@ class DynamicNotionService:
         }
 
         try:
-            self.client.pages.update(page_id=page_id, properties=properties)
+            await run_in_notion_thread(self.client.pages.update, page_id=page_id, properties=properties)
         except Exception as exc:
             print(f"⚠️ Failed to update approval reminder time in Notion: {exc}")
 
@@ -1057,7 +1075,7 @@ class DynamicNotionService:
         }
 
         try:
-            self.client.pages.update(page_id=page_id, properties=properties)
+            await run_in_notion_thread(self.client.pages.update, page_id=page_id, properties=properties)
             print(f"✅ Task {page_id} has been disabled (logical delete)")
         except Exception as exc:
             print(f"⚠️ Failed to disable task in Notion: {exc}")
@@ -1098,7 +1116,7 @@ class DynamicNotionService:
             return
 
         try:
-            self.client.pages.update(page_id=page_id, properties=properties)
+            await run_in_notion_thread(self.client.pages.update, page_id=page_id, properties=properties)
             print(f"✅ Saved thread info for task {page_id}")
         except Exception as exc:
             print(f"⚠️ Failed to save thread info to Notion: {exc}")
@@ -1110,8 +1128,10 @@ class DynamicNotionService:
         read_time: datetime,
         stage: Optional[str] = None,
     ) -> None:
+        # フォールバック時も同じ文字列を使うため1回だけ整形する
+        read_time_str = self._format_datetime(read_time)
         properties: Dict[str, Any] = {
-            TASK_PROP_LAST_READ_AT: {"date": {"start": self._format_datetime(read_time)}}
+            TASK_PROP_LAST_READ_AT: {"date": {"start": read_time_str}}
         }
 
         # ステージ別の既読フラグを優先的に使用（存在しない場合でもAPIは無視するため安全）
@@ -1124,7 +1144,7 @@ class DynamicNotionService:
             properties[TASK_PROP_REMINDER_READ] = {"checkbox": True}
 
         try:
-            self.client.pages.update(page_id=page_id, properties=properties)
+            await run_in_notion_thread(self.client.pages.update, page_id=page_id, properties=properties)
         except Exception as exc:
             print(f"⚠️ Failed to mark reminder as read: {exc}")
             # フォールバック: ステージ別プロパティが存在しない場合は従来の既読フラグ/ステージを使用
@@ -1132,9 +1152,9 @@ class DynamicNotionService:
                 fallback_props: Dict[str, Any] = {
                     TASK_PROP_REMINDER_STAGE: {"select": {"name": REMINDER_STAGE_ACKED}},
                     TASK_PROP_REMINDER_READ: {"checkbox": True},
-                    TASK_PROP_LAST_READ_AT: {"date": {"start": self._format_datetime(read_time)}},
+                    TASK_PROP_LAST_READ_AT: {"date": {"start": read_time_str}},
                 }
-                self.client.pages.update(page_id=page_id, properties=fallback_props)
+                await run_in_notion_thread(self.client.pages.update, page_id=page_id, properties=fallback_props)
                 print("🔁 Fallback: marked as read using legacy properties")
             except Exception as exc2:
                 print(f"❌ Fallback failed to mark reminder as read: {exc2}")
@@ -1170,7 +1190,7 @@ class DynamicNotionService:
         }
 
         try:
-            self.client.pages.update(page_id=page_id, properties=properties)
+            await run_in_notion_thread(self.client.pages.update, page_id=page_id, properties=properties)
         except Exception as exc:
             print(f"⚠️ Failed to register extension request: {exc}")
 
@@ -1216,7 +1236,7 @@ class DynamicNotionService:
         }
 
         try:
-            self.client.pages.update(page_id=page_id, properties=properties)
+            await run_in_notion_thread(self.client.pages.update, page_id=page_id, properties=properties)
         except Exception as exc:
             print(f"⚠️ Failed to approve extension: {exc}")
 
@@ -1231,7 +1251,7 @@ class DynamicNotionService:
         }
 
         try:
-            self.client.pages.update(page_id=page_id, properties=properties)
+            await run_in_notion_thread(self.client.pages.update, page_id=page_id, properties=properties)
         except Exception as exc:
             print(f"⚠️ Failed to reject extension: {exc}")
 
@@ -1242,12 +1262,13 @@ class DynamicNotionService:
         note: Optional[str],
         requested_before_due: bool,
     ) -> None:
+        request_time_str = self._format_datetime(request_time)
         properties = {
             TASK_PROP_COMPLETION_STATUS: {
                 "select": {"name": COMPLETION_STATUS_REQUESTED},
             },
             TASK_PROP_COMPLETION_REQUESTED_AT: {
-                "date": {"start": self._format_datetime(request_time)},
+                "date": {"start": request_time_str},
             },
             TASK_PROP_COMPLETION_APPROVED_AT: {
                 "date": None,
@@ -1262,7 +1283,7 @@ class DynamicNotionService:
                 "checkbox": True,
             },
             TASK_PROP_LAST_READ_AT: {
-                "date": {"start": self._format_datetime(request_time)},
+                "date": {"start": request_time_str},
             },
             TASK_PROP_APPROVAL_REMINDER_AT: {
                 "date": None,
@@ -1282,7 +1303,7 @@ class DynamicNotionService:
             properties[TASK_PROP_COMPLETION_NOTE] = {"rich_text": []}
 
         try:
-            self.client.pages.update(page_id=page_id, properties=properties)
+            await run_in_notion_thread(self.client.pages.update, page_id=page_id, properties=properties)
         except Exception as exc:
             print(f"⚠️ Failed to register completion request: {exc}")
 
@@ -1291,7 +1312,9 @@ class DynamicNotionService:
         page_id: str,
         approval_time: datetime,
         requested_before_due: bool,
+        status: Optional[str] = None,
     ) -> None:
+        """完了承認を記録（status指定時はタスクステータスも同じリクエストで更新する）"""
         properties = {
             TASK_PROP_COMPLETION_STATUS: {
                 "select": {"name": COMPLETION_STATUS_APPROVED},
@@ -1306,11 +1329,18 @@ class DynamicNotionService:
                 "checkbox": True,
             },
         }
+        if status:
+            properties[TASK_PROP_STATUS] = {
+                "select": {"name": self._get_status_name(status)},
+            }
 
         try:
-            self.client.pages.update(page_id=page_id, properties=properties)
+            await run_in_notion_thread(self.client.pages.update, page_id=page_id, properties=properties)
         except Exception as exc:
             print(f"⚠️ Failed to approve completion: {exc}")
+            # ステータス更新を含む場合は update_task_status と同様に呼び出し元へ伝える
+            if status:
+                raise
 
     async def reject_completion(
         self,
@@ -1357,7 +1387,7 @@ class DynamicNotionService:
         }
 
         try:
-            self.client.pages.update(page_id=page_id, properties=properties)
+            await run_in_notion_thread(self.client.pages.update, page_id=page_id, properties=properties)
         except Exception as exc:
             print(f"⚠️ Failed to reject completion request: {exc}")
 
@@ -1365,10 +1395,7 @@ class DynamicNotionService:
     def _to_snapshot(self, page: Dict[str, Any]) -> NotionTaskSnapshot:
         properties = page.get("properties", {})
 
-        title = ""
-        title_prop = properties.get(TASK_PROP_TITLE)
-        if title_prop and title_prop.get("title"):
-            title = title_prop["title"][0]["plain_text"]
+        title = self._extract_title(properties)
 
         due_prop = properties.get(TASK_PROP_DUE, {})
         due_date = self._parse_datetime(due_prop.get("date"))
@@ -1521,7 +1548,8 @@ class DynamicNotionService:
                     ],
                 }
 
-            self.client.pages.update(
+            await run_in_notion_thread(
+                self.client.pages.update,
                 page_id=page_id,
                 properties=properties,
             )
@@ -1636,7 +1664,7 @@ class DynamicNotionService:
             properties[TASK_PROP_ASSIGNEE] = {"people": []}
 
         try:
-            self.client.pages.update(page_id=task.notion_page_id, properties=properties)
+            await run_in_notion_thread(self.client.pages.update, page_id=task.notion_page_id, properties=properties)
         except Exception as update_error:
             print(f"⚠️ Failed to update Notion task properties on revision: {update_error}")
             return
@@ -1658,9 +1686,12 @@ class DynamicNotionService:
         requester_email: Optional[str],
         assignee_email: Optional[str],
     ) -> None:
-        children = self._list_page_children(page_id)
-        self._update_task_summary_callout(children, task, requester_email, assignee_email)
-        self._update_description_section(page_id, children, task.description)
+        # ブロック操作は同期クライアントを呼び出すため、スレッドで実行する
+        children = await run_in_notion_thread(self._list_page_children, page_id)
+        await run_in_notion_thread(
+            self._update_task_summary_callout, children, task, requester_email, assignee_email
+        )
+        await run_in_notion_thread(self._update_description_section, page_id, children, task.description)
 
     def _list_page_children(self, page_id: str) -> List[Dict[str, Any]]:
         results: List[Dict[str, Any]] = []
@@ -0,0 +1,156 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from notion_client import Client
+from notion_client.errors import HTTPResponseError
+
+from src.utils.concurrency import run_in_executor
+
+logger = logging.getLogger(__name__)
+
+# Notion APIの平均レート制限（約3リクエスト/秒）
+NOTION_REQUESTS_PER_SECOND = 3.0
+# 再試行するHTTPステータス（レート制限とゲートウェイ系の一時エラー）
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+# レート制限（429）はリクエストが処理されていないため、非冪等なリクエストでも再試行できる
+RATE_LIMITED_STATUS = 429
+MAX_RETRIES = 3
+BASE_BACKOFF_SECONDS = 0.5
+MAX_BACKOFF_SECONDS = 8.0
+# Notion呼び出し専用のスレッド数。レート制限やバックオフの待機でスレッドが埋まっても、
+# Slackなどが使う既定のスレッドプール（asyncio.to_thread）には影響しない
+NOTION_THREAD_WORKERS = 4
+
+T = TypeVar("T")
+
+notion_executor = ThreadPoolExecutor(
+    max_workers=NOTION_THREAD_WORKERS,
+    thread_name_prefix="notion",
+)
+
+
+async def run_in_notion_thread(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Notion APIの同期呼び出しを専用スレッドプールで実行する（asyncio.to_thread の代わり）"""
+    return await run_in_executor(notion_executor, func, *args, **kwargs)
+
+
+class _TokenBucket:
+    """スレッドセーフなトークンバケット（専用スレッドプールからの同時呼び出しにも対応）"""
+
+    def __init__(self, rate: float, capacity: float):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated_at) * self._rate,
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_seconds = (1 - self._tokens) / self._rate
+            time.sleep(wait_seconds)
+
+
+class RateLimitedNotionClient(Client):
+    """レート制限と一時エラー時の指数バックオフ再試行を備えたNotionクライアント
+
+    全エンドポイントは Client.request を経由するため、ここで一括して制御する。
+    待機には time.sleep を使うため、イベントループからは run_in_notion_thread 経由で呼び出すこと。
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        requests_per_second: float = NOTION_REQUESTS_PER_SECOND,
+        max_retries: int = MAX_RETRIES,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._bucket = _TokenBucket(requests_per_second, capacity=requests_per_second)
+        self._max_retries = max_retries
+
+    def request(
+        self,
+        path: str,
+        method: str,
+        query: Optional[Dict[Any, Any]] = None,
+        body: Optional[Dict[Any, Any]] = None,
+        form_data: Optional[Dict[Any, Any]] = None,
+        auth: Optional[str] = None,
+    ) -> Any:
+        attempt = 0
+        while True:
+            self._bucket.acquire()
+            try:
+                return super().request(
+                    path,
+                    method,
+                    query=query,
+                    body=body,
+                    form_data=form_data,
+                    auth=auth,
+                )
+            except HTTPResponseError as error:
+                # ファイル送信はストリームを再送できないため再試行しない
+                # ページ作成などの非冪等なリクエストは、ゲートウェイ系エラーでは
+                # 処理済みの可能性があり重複作成を招くため、レート制限時のみ再試行する
+                if (
+                    form_data
+                    or error.status not in RETRYABLE_STATUSES
+                    or (
+                        error.status != RATE_LIMITED_STATUS
+                        and not self._is_idempotent(path, method)
+                    )
+                    or attempt >= self._max_retries
+                ):
+                    raise
+                delay = self._retry_delay(error, attempt)
+                attempt += 1
+                logger.warning(
+                    "⚠️ Notion API %s on %s %s: retrying in %.1fs (%d/%d)",
+                    error.status,
+                    method.upper(),
+                    path,
+                    delay,
+                    attempt,
+                    self._max_retries,
+                )
+            time.sleep(delay)
+
+    @staticmethod
+    def _is_idempotent(path: str, method: str) -> bool:
+        """同じリクエストを再送しても結果が変わらないか（ページ作成・ブロック追記などは非冪等）"""
+        method = method.upper()
+        path = path.rstrip("/")
+        if method in ("GET", "DELETE"):
+            return True
+        if method == "PATCH":
+            # ブロックの子要素追加（blocks/{id}/children）は再送すると重複する
+            return not path.endswith("/children")
+        if method == "POST":
+            # databases/{id}/query と search は読み取りのみ
+            return path.endswith("/query") or path == "search"
+        return False
+
+    @staticmethod
+    def _retry_delay(error: HTTPResponseError, attempt: int) -> float:
+        """Retry-Afterヘッダーがあれば優先し、なければ指数バックオフ"""
+        retry_after = error.headers.get("Retry-After") if error.headers else None
+        if retry_after:
+            try:
+                return min(float(retry_after), MAX_BACKOFF_SECONDS)
+            except ValueError:
+                pass
+        return min(BASE_BACKOFF_SECONDS * (2 ** attempt), MAX_BACKOFF_SECONDS)
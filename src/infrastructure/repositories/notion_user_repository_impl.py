@@ -1,19 +1,35 @@
-from typing import List, Optional, Set
+import asyncio
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from notion_client import Client
 from src.domain.entities.notion_user import NotionUser
 from src.domain.repositories.notion_user_repository import NotionUserRepositoryInterface
 from src.domain.value_objects.email import Email
 from src.domain.value_objects.notion_user_id import NotionUserId
+from src.infrastructure.notion.rate_limited_client import run_in_notion_thread
 import logging
 
 logger = logging.getLogger(__name__)
 
+# DBスキーマのキャッシュ有効期間（秒）
+SCHEMA_CACHE_TTL_SECONDS = 300.0
+# データベース内Peopleのメールアドレス索引の有効期間（秒）
+PEOPLE_INDEX_TTL_SECONDS = 300.0
+# ワークスペース正規メンバー（users.list）のキャッシュ有効期間（秒）
+WORKSPACE_USERS_TTL_SECONDS = 300.0
+
 
 class NotionUserRepositoryImpl(NotionUserRepositoryInterface):
     """Notion APIを使用したユーザーリポジトリ実装"""
 
-    def __init__(self, notion_token: str, default_database_id: str, mapping_database_id: Optional[str] = None):
-        self.client = Client(auth=notion_token)
+    def __init__(
+        self,
+        notion_token: str,
+        default_database_id: str,
+        mapping_database_id: Optional[str] = None,
+        client: Optional[Client] = None,
+    ):
+        self.client = client or Client(auth=notion_token)
         self.default_database_id = self._normalize_database_id(default_database_id)
         # ユーザーマッピング専用DB（指定があればこちらを優先）
         self.mapping_database_id = (
@@ -21,6 +37,14 @@ class NotionUserRepositoryImpl(NotionUserRepositoryInterface):
             if mapping_database_id
             else None
         )
+        # データベースごとのPeopleプロパティID（スキーマは変わりにくいためTTL付きでキャッシュ）
+        # 値は (有効期限のmonotonic時刻, プロパティIDリスト)
+        self._people_property_ids: Dict[str, Tuple[float, List[str]]] = {}
+        # データベースごとの メール（小文字）→ NotionUser 索引。走査で見かけた全員を登録する
+        # 値は (有効期限のmonotonic時刻, 索引)
+        self._people_index: Dict[str, Tuple[float, Dict[str, NotionUser]]] = {}
+        # ワークスペース正規メンバー: (有効期限のmonotonic時刻, 全ユーザー, メール（小文字）→ NotionUser)
+        self._workspace_users: Optional[Tuple[float, List[NotionUser], Dict[str, NotionUser]]] = None
 
     def _normalize_database_id(self, database_id: str) -> str:
         """データベースIDを正規化（ハイフンを削除）"""
@@ -39,12 +63,12 @@ class NotionUserRepositoryImpl(NotionUserRepositoryInterface):
             logger.info(f"✅ データベースで発見: {database_users[0].name} ({email})")
             return database_users[0]
 
-        # 2. 正規メンバーから検索
-        workspace_users = await self.get_all_workspace_users()
-        for user in workspace_users:
-            if user.email.normalized() == email.normalized():
-                logger.info(f"✅ 正規メンバーで発見: {user.name} ({email})")
-                return user
+        # 2. 正規メンバーから検索（先読みしたメール索引で照合）
+        workspace_index = await self._get_workspace_index()
+        user = workspace_index.get(email.value.lower())
+        if user:
+            logger.info(f"✅ 正規メンバーで発見: {user.name} ({email})")
+            return user
 
         logger.warning(f"❌ ユーザーが見つかりません: {email}")
         return None
@@ -52,48 +76,108 @@ class NotionUserRepositoryImpl(NotionUserRepositoryInterface):
     async def find_by_id(self, user_id: NotionUserId) -> Optional[NotionUser]:
         """ユーザーIDでユーザーを取得"""
         try:
-            response = self.client.users.retrieve(user_id=str(user_id))
+            response = await run_in_notion_thread(self.client.users.retrieve, user_id=str(user_id))
             return NotionUser.from_notion_api_response(response)
         except Exception as e:
             logger.warning(f"❌ ユーザーID検索エラー {user_id}: {e}")
             return None
 
+    async def find_by_emails(self, emails: List[Email]) -> Dict[Email, NotionUser]:
+        """複数のメールアドレスでユーザーをまとめて検索
+
+        データベースの全件走査とusers.list()をそれぞれ最大1回に抑え、以降は索引で照合する。
+        """
+        if not emails:
+            return {}
+
+        target_db = self.mapping_database_id or self.default_database_id
+        if any(email.value.lower() not in self._get_people_index(target_db) for email in emails):
+            # 全件走査で索引を埋める（索引にあるメールだけなら走査しない）
+            await self.search_users_in_database(target_db)
+        people_index = self._get_people_index(target_db)
+
+        found: Dict[Email, NotionUser] = {}
+        missing: List[Email] = []
+        for email in emails:
+            user = people_index.get(email.value.lower())
+            if user:
+                found[email] = user
+            else:
+                missing.append(email)
+
+        if missing:
+            workspace_index = await self._get_workspace_index()
+            for email in missing:
+                user = workspace_index.get(email.value.lower())
+                if user:
+                    found[email] = user
+
+        logger.info(f"🔍 ユーザー一括検索: {len(found)}/{len(emails)}人発見")
+        return found
+
+
     async def search_users_in_database(
         self, 
         database_id: str,
         email: Optional[Email] = None
     ) -> List[NotionUser]:
         """データベース内のPeopleプロパティからユーザーを検索"""
-        users = []
+        target_key = email.value.lower() if email else None
+        people_index = self._get_people_index(database_id)
+        if target_key and target_key in people_index:
+            logger.info(f"⚡ データベース索引で発見: {email}")
+            return [people_index[target_key]]
+
+        # メールアドレス（小文字）をキーにページ走査中に重複除去する
+        users_by_email: Dict[str, NotionUser] = {}
+        users_found = 0
         try:
             logger.info(f"📊 データベース検索開始: {database_id}")
             
             # データベース内の全ページを取得
-            has_more = True
-            next_cursor = None
+            # 次ページの取得をバックグラウンドで先行させ、現在ページの解析と重ねる
             pages_scanned = 0
-            
-            while has_more:
-                query_params = {"database_id": database_id}
-                if next_cursor:
-                    query_params["start_cursor"] = next_cursor
+            property_ids = await self._get_people_property_ids(database_id)
+            pending = asyncio.create_task(
+                self._query_database_page(database_id, property_ids=property_ids)
+            )
+
+            while pending:
+                response = await pending
+                pending = None
+
+                next_cursor = response.get('next_cursor')
+                if response.get('has_more', False) and next_cursor:
+                    pending = asyncio.create_task(
+                        self._query_database_page(database_id, next_cursor, property_ids)
+                    )
 
-                response = self.client.databases.query(**query_params)
                 pages = response.get('results', [])
                 pages_scanned += len(pages)
 
                 for page in pages:
-                    page_users = self._extract_users_from_page(page, email)
-                    users.extend(page_users)
+                    # 特定メールの検索中も走査したページの全員を索引に載せ、以後の検索を走査なしで返す
+                    for user in self._extract_users_from_page(page):
+                        users_found += 1
+                        email_key = user.email.value.lower()
+                        if email_key not in users_by_email:
+                            users_by_email[email_key] = user
+                            people_index[email_key] = user
 
-                has_more = response.get('has_more', False)
-                next_cursor = response.get('next_cursor')
+                # 特定メールの検索は最初に見つかった時点で残りのページを読まない
+                if target_key and target_key in users_by_email:
+                    if pending:
+                        pending.cancel()
+                    break
 
-            logger.info(f"📋 データベーススキャン完了: {pages_scanned}ページ, {len(users)}ユーザー発見")
-            
-            # 重複除去（メールアドレスベース）
-            unique_users = self._deduplicate_users(users)
-            return unique_users
+            logger.info(f"📋 データベーススキャン完了: {pages_scanned}ページ, {users_found}ユーザー発見")
+            if users_found != len(users_by_email):
+                logger.info(f"🔄 重複ユーザー削除: {users_found} → {len(users_by_email)}")
+
+            if target_key:
+                user = users_by_email.get(target_key)
+                return [user] if user else []
+            return list(users_by_email.values())
 
         except Exception as e:
             # Notionの結合データベース（multi-source）に対するAPI制約の明示化
@@ -106,36 +190,121 @@ class NotionUserRepositoryImpl(NotionUserRepositoryInterface):
                 logger.error(f"❌ データベース検索エラー: {e}")
             return []
 
+    def _get_people_index(self, database_id: str) -> Dict[str, NotionUser]:
+        """データベースのメール索引を取得（期限切れなら空の索引に差し替える）"""
+        now = time.monotonic()
+        cached = self._people_index.get(database_id)
+        if cached and now < cached[0]:
+            return cached[1]
+
+        index: Dict[str, NotionUser] = {}
+        self._people_index[database_id] = (now + PEOPLE_INDEX_TTL_SECONDS, index)
+        return index
+
+    async def _query_database_page(
+        self,
+        database_id: str,
+        start_cursor: Optional[str] = None,
+        property_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """databases.queryを1ページ分実行（同期クライアントのためスレッドで実行）"""
+        query_params: Dict[str, Any] = {"database_id": database_id, "page_size": 100}
+        if start_cursor:
+            query_params["start_cursor"] = start_cursor
+        if property_ids:
+            # Peopleプロパティだけを返させてレスポンスを小さくする
+            query_params["filter_properties"] = property_ids
+        return await run_in_notion_thread(self.client.databases.query, **query_params)
+
+    async def _get_people_property_ids(self, database_id: str) -> Optional[List[str]]:
+        """データベースのPeopleプロパティIDを取得（取得失敗時はNone＝全プロパティ）"""
+        cached = self._people_property_ids.get(database_id)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+
+        try:
+            database = await run_in_notion_thread(
+                self.client.databases.retrieve, database_id=database_id
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ データベーススキーマ取得エラー {database_id}: {e}")
+            return None
+
+        property_ids = [
+            prop["id"]
+            for prop in database.get('properties', {}).values()
+            if prop.get('type') == 'people' and prop.get('id')
+        ]
+        self._people_property_ids[database_id] = (
+            time.monotonic() + SCHEMA_CACHE_TTL_SECONDS,
+            property_ids,
+        )
+        return property_ids
+
     async def search_users_by_domain(self, domain: str) -> List[NotionUser]:
         """ドメイン名でユーザーを検索"""
         all_users = await self.get_users_from_database_properties(self.default_database_id)
-        
+        domain_key = domain.lower()
+
         return [
             user for user in all_users
-            if user.email.domain().lower() == domain.lower()
+            if user.email.domain().lower() == domain_key
         ]
 
     async def get_all_workspace_users(self) -> List[NotionUser]:
-        """ワークスペースの全正規ユーザーを取得（users.list()）"""
-        users = []
+        """ワークスペースの全正規ユーザーを取得（users.list()、TTL付きでキャッシュ）"""
+        cached = await self._get_workspace_users()
+        return list(cached[1]) if cached else []
+
+    async def prefetch_workspace(self, ttl_seconds: Optional[float] = None) -> None:
+        """ワークスペースの全正規ユーザーを先読みし、メール索引としてキャッシュ（取得失敗時はキャッシュしない）"""
+        users: List[NotionUser] = []
         try:
-            response = self.client.users.list()
-            logger.info(f"👥 正規メンバー取得: {len(response.get('results', []))}人")
-            
-            for user_data in response.get("results", []):
-                if user_data.get("type") == "person":
-                    try:
-                        user = NotionUser.from_notion_api_response(user_data)
-                        users.append(user)
-                    except Exception as e:
-                        logger.warning(f"⚠️ ユーザー変換エラー: {e}")
-                        continue
-            
-            return users
-        
+            # users.listは1回100件までのため、カーソルで全件をまとめて取得する
+            results: List[Dict[str, Any]] = []
+            start_cursor: Optional[str] = None
+            while True:
+                params: Dict[str, Any] = {"page_size": 100}
+                if start_cursor:
+                    params["start_cursor"] = start_cursor
+                response = await run_in_notion_thread(self.client.users.list, **params)
+                results.extend(response.get("results", []))
+                start_cursor = response.get("next_cursor")
+                if not (response.get("has_more") and start_cursor):
+                    break
+            logger.info(f"👥 正規メンバー取得: {len(results)}人")
         except Exception as e:
             logger.error(f"❌ 正規メンバー取得エラー: {e}")
-            return []
+            return
+
+        for user_data in results:
+            if user_data.get("type") == "person":
+                try:
+                    users.append(NotionUser.from_notion_api_response(user_data))
+                except Exception as e:
+                    logger.warning(f"⚠️ ユーザー変換エラー: {e}")
+                    continue
+
+        index: Dict[str, NotionUser] = {}
+        for user in users:
+            index.setdefault(user.email.value.lower(), user)
+        ttl = WORKSPACE_USERS_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self._workspace_users = (time.monotonic() + ttl, users, index)
+
+    async def _get_workspace_users(
+        self,
+    ) -> Optional[Tuple[float, List[NotionUser], Dict[str, NotionUser]]]:
+        """正規メンバーのキャッシュを取得（期限切れなら先読みし直す）"""
+        cached = self._workspace_users
+        if not cached or time.monotonic() >= cached[0]:
+            await self.prefetch_workspace()
+            cached = self._workspace_users
+        return cached
+
+    async def _get_workspace_index(self) -> Dict[str, NotionUser]:
+        """正規メンバーのメール索引を取得"""
+        cached = await self._get_workspace_users()
+        return cached[2] if cached else {}
 
     async def get_users_from_database_properties(
         self, 
@@ -149,10 +318,10 @@ class NotionUserRepositoryImpl(NotionUserRepositoryInterface):
         self, 
         page: dict, 
         target_email: Optional[Email] = None
-    ) -> List[NotionUser]:
-        """ページからユーザー情報を抽出"""
-        users = []
+    ) -> Iterator[NotionUser]:
+        """ページからユーザー情報を抽出（呼び出し側で逐次重複除去できるようジェネレーターで返す）"""
         properties = page.get('properties', {})
+        target_key = target_email.value.lower() if target_email else None
 
         for prop_name, prop_data in properties.items():
             if prop_data.get('type') == 'people':
@@ -165,34 +334,17 @@ class NotionUserRepositoryImpl(NotionUserRepositoryInterface):
                             continue
 
                         # 特定のメールアドレスを検索中の場合、一致チェック
-                        if target_email and Email(person_email).normalized() != target_email.normalized():
+                        if target_key and person_email.lower() != target_key:
                             continue
 
                         user = NotionUser.from_notion_api_response(person)
-                        users.append(user)
-                        
-                        # 特定のメール検索の場合、最初のマッチで終了
-                        if target_email:
-                            return users
 
                     except Exception as e:
                         logger.warning(f"⚠️ ユーザー抽出エラー: {e}")
                         continue
 
-        return users
-
-    def _deduplicate_users(self, users: List[NotionUser]) -> List[NotionUser]:
-        """ユーザーリストから重複を削除（メールアドレスベース）"""
-        seen_emails: Set[str] = set()
-        unique_users = []
-
-        for user in users:
-            email_key = str(user.email.normalized())
-            if email_key not in seen_emails:
-                seen_emails.add(email_key)
-                unique_users.append(user)
-
-        if len(users) != len(unique_users):
-            logger.info(f"🔄 重複ユーザー削除: {len(users)} → {len(unique_users)}")
+                    yield user
 
-        return unique_users
+                    # 特定のメール検索の場合、最初のマッチで終了
+                    if target_key:
+                        return
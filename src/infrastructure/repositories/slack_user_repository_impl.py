@@ -1,24 +1,30 @@
-from typing import Optional
+import asyncio
+from typing import Dict, List, Optional
 from slack_sdk import WebClient
 from src.domain.entities.slack_user import SlackUser
 from src.domain.repositories.slack_user_repository import SlackUserRepositoryInterface
 from src.domain.value_objects.email import Email
 from src.domain.value_objects.slack_user_id import SlackUserId
+from src.utils.concurrency import ConcurrencyCoordinator
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 一括検索で同時に発行するusers.lookupByEmailの上限（スレッドとSlackのレート制限を占有しない）
+BULK_LOOKUP_CONCURRENCY = 4
+
 
 class SlackUserRepositoryImpl(SlackUserRepositoryInterface):
     """Slack APIを使用したユーザーリポジトリ実装"""
 
     def __init__(self, slack_token: str):
         self.client = WebClient(token=slack_token)
+        self._bulk_lookup_guard = ConcurrencyCoordinator(max_concurrency=BULK_LOOKUP_CONCURRENCY)
 
     async def find_by_id(self, user_id: SlackUserId) -> Optional[SlackUser]:
         """SlackユーザーIDでユーザーを取得"""
         try:
-            response = self.client.users_info(user=str(user_id))
+            response = await asyncio.to_thread(self.client.users_info, user=str(user_id))
             
             if response["ok"] and response.get("user"):
                 user_data = response["user"]
@@ -33,7 +39,7 @@ class SlackUserRepositoryImpl(SlackUserRepositoryInterface):
     async def find_by_email(self, email: Email) -> Optional[SlackUser]:
         """メールアドレスでユーザーを検索"""
         try:
-            response = self.client.users_lookupByEmail(email=str(email))
+            response = await asyncio.to_thread(self.client.users_lookupByEmail, email=str(email))
             
             if response["ok"] and response.get("user"):
                 user_data = response["user"]
@@ -45,6 +51,18 @@ class SlackUserRepositoryImpl(SlackUserRepositoryInterface):
             logger.warning(f"⚠️ Slack メール検索エラー {email}: {e}")
             return None
 
+    async def find_by_emails(self, emails: List[Email]) -> Dict[Email, SlackUser]:
+        """複数のメールアドレスでユーザーをまとめて検索（users.lookupByEmailを上限付きで並行実行）"""
+        unique_emails = list(dict.fromkeys(emails))
+        users = await asyncio.gather(
+            *(self._bulk_lookup_guard.run(self.find_by_email, email) for email in unique_emails)
+        )
+        return {
+            email: user
+            for email, user in zip(unique_emails, users)
+            if user
+        }
+
     async def get_user_info(self, user_id: str) -> Optional[SlackUser]:
         """ユーザー情報を取得（文字列IDから）"""
         try:
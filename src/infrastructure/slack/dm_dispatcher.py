@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.infrastructure.slack.slack_service import SlackService
+
+logger = logging.getLogger(__name__)
+
+# 全宛先合計の送信レート（通/秒）とワーカー数の既定値
+DEFAULT_MESSAGES_PER_SECOND = 5.0
+DEFAULT_WORKERS = 4
+
+_QueuedMessage = Tuple[str, str, Optional[List[Dict[str, Any]]], Optional[str]]
+
+
+class SlackDirectMessageDispatcher:
+    """Slack DMをキューに積み、バックグラウンドのワーカーがレート制限しながら送信する
+
+    呼び出し側は送信完了を待たずに処理を続けられる（送信失敗はログのみ）。
+    """
+
+    def __init__(
+        self,
+        slack_service: SlackService,
+        *,
+        messages_per_second: float = DEFAULT_MESSAGES_PER_SECOND,
+        workers: int = DEFAULT_WORKERS,
+    ) -> None:
+        if messages_per_second <= 0:
+            raise ValueError("messages_per_second must be greater than zero")
+        if workers <= 0:
+            raise ValueError("workers must be greater than zero")
+        self._slack_service = slack_service
+        self._interval = 1.0 / messages_per_second
+        self._workers = workers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional["asyncio.Queue[_QueuedMessage]"] = None
+        self._rate_lock: Optional[asyncio.Lock] = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._next_send_at = 0.0
+
+    def enqueue(
+        self,
+        slack_user_id: str,
+        *,
+        text: str,
+        blocks: Optional[List[Dict[str, Any]]] = None,
+        label: Optional[str] = None,
+    ) -> None:
+        """DMを送信キューに追加（実行中のイベントループ内から呼び出す）"""
+        queue = self._ensure_workers()
+        queue.put_nowait((slack_user_id, text, blocks, label))
+
+    async def join(self) -> None:
+        """キュー内のDMがすべて処理されるまで待つ"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    def _ensure_workers(self) -> "asyncio.Queue[_QueuedMessage]":
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            # キューとロックは生成したイベントループに紐づくため、ループが変わったら作り直す
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._rate_lock = asyncio.Lock()
+            self._worker_tasks = []
+
+        self._worker_tasks = [task for task in self._worker_tasks if not task.done()]
+        while len(self._worker_tasks) < self._workers:
+            self._worker_tasks.append(loop.create_task(self._run_worker(self._queue)))
+        return self._queue
+
+    async def _run_worker(self, queue: "asyncio.Queue[_QueuedMessage]") -> None:
+        while True:
+            slack_user_id, text, blocks, label = await queue.get()
+            try:
+                await self._wait_for_send_slot()
+                await self._slack_service.send_direct_message(
+                    slack_user_id,
+                    text=text,
+                    blocks=blocks,
+                )
+            except Exception as error:
+                logger.error(
+                    "⚠️ Slack DMの送信に失敗しました (%s): %s",
+                    label or slack_user_id,
+                    error,
+                )
+            finally:
+                queue.task_done()
+
+    async def _wait_for_send_slot(self) -> None:
+        """送信間隔を全ワーカーで共有し、合計レートを上限内に保つ"""
+        assert self._rate_lock is not None
+        async with self._rate_lock:
+            now = time.monotonic()
+            wait_seconds = self._next_send_at - now
+            self._next_send_at = max(now, self._next_send_at) + self._interval
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
@@ -1,6 +1,8 @@
 import asyncio
 import copy
 import json
+import logging
+import time
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List, Tuple, Union
 from slack_sdk import WebClient
@@ -43,6 +45,11 @@ URGENCY_OPTIONS: List[Dict[str, Any]] = [
 
 JST = ZoneInfo("Asia/Tokyo")
 
+# users.info の結果キャッシュの有効期間（秒）。メールや氏名は短時間ではほぼ変わらない
+USER_INFO_CACHE_TTL_SECONDS = 300.0
+
+logger = logging.getLogger(__name__)
+
 
 class SlackService:
     """Slack APIサービス"""
@@ -51,6 +58,10 @@ class SlackService:
         self.client = WebClient(token=slack_bot_token)
         self.user_client = WebClient(token=slack_token)
         self.env = env
+        # ユーザーID -> (有効期限のmonotonic時刻, users.info のユーザー情報)
+        self._user_info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # 問い合わせ中のユーザーID -> 結果のTask
+        self._user_info_inflight: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
 
     @property
     def app_name_suffix(self) -> str:
@@ -387,16 +398,16 @@ class SlackService:
         text: str,
         blocks: Optional[List[Dict[str, Any]]] = None,
     ) -> None:
-        """指定ユーザーへDMを送信"""
+        """指定ユーザーへDMを送信（同期クライアントのためスレッドで実行し、複数宛先の並行送信を可能にする）"""
         try:
-            dm = self.client.conversations_open(users=slack_user_id)
+            dm = await asyncio.to_thread(self.client.conversations_open, users=slack_user_id)
             payload: Dict[str, Any] = {
                 "channel": dm["channel"]["id"],
                 "text": text,
             }
             if blocks:
                 payload["blocks"] = blocks
-            self.client.chat_postMessage(**payload)
+            await asyncio.to_thread(self.client.chat_postMessage, **payload)
         except SlackApiError as e:
             print(f"⚠️ Error sending direct message to {slack_user_id}: {e}")
             raise
@@ -646,7 +657,8 @@ class SlackService:
                     requester_slack_id=requester_slack_id,
                     status=new_status,
                 )
-                self._update_message(
+                await asyncio.to_thread(
+                    self._update_message,
                     channel=assignee_thread_channel,
                     ts=assignee_thread_ts,
                     blocks=assignee_blocks,
@@ -662,7 +674,8 @@ class SlackService:
                     assignee_slack_id=assignee_slack_id,
                     status=new_status,
                 )
-                self._update_message(
+                await asyncio.to_thread(
+                    self._update_message,
                     channel=requester_thread_channel,
                     ts=requester_thread_ts,
                     blocks=requester_blocks,
@@ -675,23 +688,48 @@ class SlackService:
             # エラーでも続行（親メッセージ更新失敗は致命的ではない）
 
     async def get_user_info(self, user_id: str) -> Dict[str, Any]:
-        """ユーザー情報を取得"""
+        """ユーザー情報を取得（成功結果は短時間キャッシュする）"""
+        cached = self._user_info_cache.get(user_id)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+
+        # 同じユーザーへの同時問い合わせは1回にまとめ、後続は同じ結果（失敗時の空dictを含む）を待つ
+        inflight = self._user_info_inflight.get(user_id)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        task = asyncio.ensure_future(self._fetch_user_info(user_id))
+        self._user_info_inflight[user_id] = task
         try:
-            print(f"🔍 Getting user info for: {user_id}")
-            response = self.client.users_info(user=user_id)
-            user_data = response["user"]
+            return await asyncio.shield(task)
+        finally:
+            if task.done():
+                self._user_info_inflight.pop(user_id, None)
+            else:
+                # 呼び出し元がキャンセルされても問い合わせは継続し、完了時に登録を外す
+                task.add_done_callback(lambda _: self._user_info_inflight.pop(user_id, None))
 
-            print(f"📋 User data keys: {list(user_data.keys())}")
+    async def _fetch_user_info(self, user_id: str) -> Dict[str, Any]:
+        try:
+            logger.debug("🔍 Getting user info for: %s", user_id)
+            response = await asyncio.to_thread(self.client.users_info, user=user_id)
+            user_data = response["user"]
+            self._user_info_cache[user_id] = (
+                time.monotonic() + USER_INFO_CACHE_TTL_SECONDS,
+                user_data,
+            )
 
-            # プロフィール情報の詳細チェック
-            if "profile" in user_data:
-                profile = user_data["profile"]
-                print(f"👤 Profile keys: {list(profile.keys())}")
-                print(f"📧 Email in profile: {profile.get('email', 'No email')}")
-                print(f"🏢 Email (display): {profile.get('display_name', 'No display name')}")
-                print(f"🏷️ Real name: {profile.get('real_name', 'No real name')}")
-            else:
-                print("❌ No profile data found")
+            # プロフィール情報の詳細チェック（DEBUG時のみ組み立てる）
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📋 User data keys: %s", list(user_data.keys()))
+                if "profile" in user_data:
+                    profile = user_data["profile"]
+                    logger.debug("👤 Profile keys: %s", list(profile.keys()))
+                    logger.debug("📧 Email in profile: %s", profile.get('email', 'No email'))
+                    logger.debug("🏢 Email (display): %s", profile.get('display_name', 'No display name'))
+                    logger.debug("🏷️ Real name: %s", profile.get('real_name', 'No real name'))
+                else:
+                    logger.debug("❌ No profile data found")
 
             return user_data
         except SlackApiError as e:
@@ -784,7 +822,9 @@ class SlackService:
             if thread_channel:
                 channel_id = thread_channel
             else:
-                dm_response = self.client.conversations_open(users=requester_slack_id)
+                dm_response = await asyncio.to_thread(
+                    self.client.conversations_open, users=requester_slack_id
+                )
                 channel_id = dm_response["channel"]["id"]
 
             blocks = [
@@ -798,7 +838,8 @@ class SlackService:
             ]
 
             # スレッド返信として送信
-            self._send_message_with_thread(
+            await asyncio.to_thread(
+                self._send_message_with_thread,
                 channel=channel_id,
                 blocks=blocks,
                 text="✅ タスクが承認されました",
@@ -821,7 +862,9 @@ class SlackService:
             if thread_channel:
                 channel_id = thread_channel
             else:
-                dm_response = self.client.conversations_open(users=requester_slack_id)
+                dm_response = await asyncio.to_thread(
+                    self.client.conversations_open, users=requester_slack_id
+                )
                 channel_id = dm_response["channel"]["id"]
 
             blocks = [
@@ -838,7 +881,8 @@ class SlackService:
             ]
 
             # スレッド返信として送信
-            self._send_message_with_thread(
+            await asyncio.to_thread(
+                self._send_message_with_thread,
                 channel=channel_id,
                 blocks=blocks,
                 text="❌ タスクが差し戻されました",
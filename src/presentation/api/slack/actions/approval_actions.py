@@ -15,6 +15,14 @@ from src.infrastructure.notion.dynamic_notion_service import (
 from src.domain.value_objects.email import Email
 from src.presentation.api.slack.context import SlackDependencies
 
+# Notion上のステータス表示名 -> ドメインのタスクステータス（完了済みは承認済みとして扱う）
+_SNAPSHOT_STATUS_TO_TASK_STATUS = {
+    TASK_STATUS_PENDING: TaskStatus.PENDING,
+    TASK_STATUS_APPROVED: TaskStatus.APPROVED,
+    TASK_STATUS_REJECTED: TaskStatus.REJECTED,
+    TASK_STATUS_COMPLETED: TaskStatus.APPROVED,
+}
+
 
 async def handle_approve_task_action(
     payload: Dict[str, Any],
@@ -67,15 +75,11 @@ async def handle_approve_task_action(
             if assignee_user:
                 assignee_slack_id = str(assignee_user.user_id)
 
-        due_date = snapshot.due_date or datetime.now()
-        status_map = {
-            TASK_STATUS_PENDING: TaskStatus.PENDING,
-            TASK_STATUS_APPROVED: TaskStatus.APPROVED,
-            TASK_STATUS_REJECTED: TaskStatus.REJECTED,
-            TASK_STATUS_COMPLETED: TaskStatus.APPROVED,
-        }
-        status = status_map.get(getattr(snapshot, "status", None), TaskStatus.PENDING)
+        now = datetime.now()
+        due_date = snapshot.due_date or now
+        status = _SNAPSHOT_STATUS_TO_TASK_STATUS.get(getattr(snapshot, "status", None), TaskStatus.PENDING)
 
+        # 全フィールドを明示して、既定値ファクトリ（UUID・現在時刻）を走らせずに復元する
         hydrated = TaskRequest(
             id=task_id,
             requester_slack_id=requester_slack_id or "",
@@ -86,13 +90,11 @@ async def handle_approve_task_action(
             task_type=getattr(snapshot, "task_type", ""),
             urgency=getattr(snapshot, "urgency", ""),
             status=status,
+            created_at=snapshot.created_time or now,
+            updated_at=now,
             notion_page_id=snapshot.page_id,
         )
 
-        if snapshot.created_time:
-            hydrated.created_at = snapshot.created_time
-        hydrated.updated_at = datetime.now()
-
         await dependencies.task_repository.save(hydrated)
         return hydrated
 
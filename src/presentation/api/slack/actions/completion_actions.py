@@ -125,12 +125,13 @@ async def handle_completion_approval_action(
                 )
                 eligible_for_overdue_points = getattr(snapshot, "status", None) == "承認済み"
 
+                # 完了承認とステータス更新は同じページへの書き込みのため1回のリクエストにまとめる
                 await notion_service.approve_completion(
                     page_id,
                     approval_time,
                     requested_before_due,
+                    status="completed",
                 )
-                await notion_service.update_task_status(page_id, "completed")
 
                 actor_email = None
                 if actor_slack_id:
@@ -165,7 +166,7 @@ async def handle_completion_approval_action(
                     snapshot_for_metrics,
                     overdue_points=target_points,
                 )
-                await task_metrics_service.refresh_assignee_summaries()
+                task_metrics_service.schedule_assignee_summary_refresh()
 
             display_snapshot = refreshed_snapshot or snapshot
 
@@ -218,7 +218,7 @@ async def handle_approve_extension_action(
                             target_snapshot,
                             reminder_stage=target_snapshot.reminder_stage,
                         )
-                        await task_metrics_service.refresh_assignee_summaries()
+                        task_metrics_service.schedule_assignee_summary_refresh()
 
             if missing_request:
                 slack_service.update_modal_message(
@@ -333,7 +333,7 @@ async def handle_reject_extension_action(
                         target_snapshot,
                         reminder_stage=target_snapshot.reminder_stage,
                     )
-                    await task_metrics_service.refresh_assignee_summaries()
+                    task_metrics_service.schedule_assignee_summary_refresh()
 
             display_snapshot = refreshed_snapshot or snapshot
 
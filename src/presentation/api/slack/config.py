@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from typing import List, Optional, Union
 
 from pydantic import Field
@@ -80,3 +81,9 @@ class Settings(BaseSettings):
             return [item.strip() for item in stripped.split(",") if item.strip()]
 
         return []
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """設定を1度だけ読み込んで使い回す（.envの再パースを避ける）"""
+    return Settings()
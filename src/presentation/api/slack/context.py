@@ -2,8 +2,10 @@ from dataclasses import dataclass
 from typing import Optional
 
 from src.infrastructure.slack.slack_service import SlackService
+from src.infrastructure.slack.dm_dispatcher import SlackDirectMessageDispatcher
 from src.infrastructure.notion.dynamic_notion_service import DynamicNotionService
 from src.infrastructure.notion.admin_metrics_service import AdminMetricsNotionService
+from src.infrastructure.notion.rate_limited_client import RateLimitedNotionClient
 from src.infrastructure.repositories.notion_user_repository_impl import NotionUserRepositoryImpl
 from src.infrastructure.repositories.slack_user_repository_impl import SlackUserRepositoryImpl
 from src.infrastructure.repositories.task_repository_impl import InMemoryTaskRepository
@@ -18,7 +20,7 @@ from src.application.services.task_metrics_service import TaskMetricsApplication
 from src.application.services.calendar_task_service import CalendarTaskApplicationService
 from src.services.ai_service import TaskAIService
 from src.utils.concurrency import ConcurrencyCoordinator
-from .config import Settings
+from .config import Settings, get_settings
 
 
 @dataclass
@@ -38,19 +40,24 @@ class SlackDependencies:
     calendar_task_service: Optional[CalendarTaskApplicationService]
     ai_service: Optional[TaskAIService]
     task_concurrency: ConcurrencyCoordinator
+    dm_dispatcher: SlackDirectMessageDispatcher
 
 
 def build_slack_dependencies() -> SlackDependencies:
-    settings = Settings()
+    settings = get_settings()
 
     task_repository = InMemoryTaskRepository()
     user_repository = InMemoryUserRepository()
     slack_service = SlackService(settings.slack_token, settings.slack_bot_token, settings.env)
 
+    # Notion APIクライアントは全サービスで共有し、keep-alive接続とレート制限を共通化する
+    notion_client = RateLimitedNotionClient(auth=settings.notion_token)
+
     notion_user_repository = NotionUserRepositoryImpl(
         notion_token=settings.notion_token,
         default_database_id=settings.notion_database_id,
         mapping_database_id=settings.mapping_database_id or None,
+        client=notion_client,
     )
     slack_user_repository = SlackUserRepositoryImpl(slack_token=settings.slack_bot_token)
     mapping_domain_service = UserMappingDomainService()
@@ -59,10 +66,12 @@ def build_slack_dependencies() -> SlackDependencies:
         slack_user_repository=slack_user_repository,
         mapping_domain_service=mapping_domain_service,
     )
+    dm_dispatcher = SlackDirectMessageDispatcher(slack_service)
     task_event_notification_service_instance = TaskEventNotificationService(
         slack_service=slack_service,
         slack_user_repository=slack_user_repository,
         notification_emails=settings.task_event_notification_emails or [],
+        dm_dispatcher=dm_dispatcher,
     )
     task_event_notification_service = (
         task_event_notification_service_instance
@@ -75,12 +84,14 @@ def build_slack_dependencies() -> SlackDependencies:
         database_id=settings.notion_database_id,
         user_mapping_service=user_mapping_service,
         audit_database_id=settings.notion_audit_database_id,
+        client=notion_client,
     )
 
     admin_metrics_service = AdminMetricsNotionService(
         notion_token=settings.notion_token,
         metrics_database_id=settings.notion_metrics_database_id,
         summary_database_id=settings.notion_assignee_summary_database_id,
+        client=notion_client,
     )
     task_metrics_service = TaskMetricsApplicationService(
         admin_metrics_service=admin_metrics_service,
@@ -142,4 +153,5 @@ def build_slack_dependencies() -> SlackDependencies:
         calendar_task_service=calendar_task_service,
         ai_service=ai_service,
         task_concurrency=task_concurrency,
+        dm_dispatcher=dm_dispatcher,
     )
@@ -65,6 +65,7 @@ task_service = dependencies.task_service
 calendar_task_service = dependencies.calendar_task_service
 ai_service = dependencies.ai_service
 task_concurrency = dependencies.task_concurrency
+dm_dispatcher = dependencies.dm_dispatcher
 
 modal_sessions = {}
 modal_registry = ModalRegistry()
@@ -120,6 +121,30 @@ async def run_reminders():
         email_cache[email] = None
         return None
 
+    # 通知対象の宛先を先に集め、Slackユーザーはまとめて検索する（タスクごとの逐次検索を避ける）
+    notify_emails: Dict[str, Email] = {}
+    for snapshot in snapshots:
+        try:
+            stage = determine_reminder_stage(snapshot, now)
+            if not stage or not _should_notify_reminder(snapshot, stage):
+                continue
+            for email in (snapshot.assignee_email, snapshot.requester_email):
+                if email and email not in notify_emails:
+                    notify_emails[email] = Email(email)
+        except Exception:
+            # 判定やメール形式のエラーは以降のループで個別に扱う
+            continue
+
+    if notify_emails:
+        try:
+            slack_users = await slack_user_repository.find_by_emails(list(notify_emails.values()))
+            for email, email_vo in notify_emails.items():
+                slack_user = slack_users.get(email_vo)
+                email_cache[email] = str(slack_user.user_id) if slack_user else None
+        except Exception as lookup_error:
+            # まとめて検索できなかった場合はループ内で1件ずつ検索する
+            print(f"⚠️ Slack bulk lookup failed: {lookup_error}")
+
     for snapshot in snapshots:
         try:
             stage = determine_reminder_stage(snapshot, now)
@@ -133,37 +158,7 @@ async def run_reminders():
                         metrics_cache[snapshot.page_id] = updated_metrics
                 continue
 
-            # 通知の要否を判定
-            should_notify = False
-            if stage == REMINDER_STAGE_BEFORE:
-                # 期日前は一度だけ通知（従来通り）
-                should_notify = stage != snapshot.reminder_stage
-            elif stage == REMINDER_STAGE_DUE:
-                # 当日は既読になるまで毎回通知
-                due_read = getattr(snapshot, "due_stage_read", False)
-                has_due_prop = getattr(snapshot, "has_due_read_prop", False)
-                if has_due_prop:
-                    should_notify = not due_read
-                else:
-                    # 後方互換: 従来の既読フラグで制御（押されるまで送る）
-                    should_notify = not getattr(snapshot, "reminder_read", False)
-            elif stage == REMINDER_STAGE_OVERDUE:
-                # 超過は必ず一度は通知し、その後は既読で止める
-                overdue_read = getattr(snapshot, "overdue_stage_read", False)
-                has_overdue_prop = getattr(snapshot, "has_overdue_read_prop", False)
-                if has_overdue_prop:
-                    should_notify = not overdue_read
-                else:
-                    # 後方互換: ステージが超過に変わったら少なくとも一度は送る。以後は従来の既読で止める。
-                    if snapshot.reminder_stage != REMINDER_STAGE_OVERDUE:
-                        should_notify = True
-                    else:
-                        should_notify = not getattr(snapshot, "reminder_read", False)
-            else:
-                # その他はステージ変化時のみ
-                should_notify = stage != snapshot.reminder_stage
-
-            if not should_notify:
+            if not _should_notify_reminder(snapshot, stage):
                 await task_metrics_service.update_reminder_stage(snapshot.page_id, stage, now)
                 continue
 
@@ -1695,7 +1690,7 @@ async def handle_interactive(request: Request):
                         snapshot_for_metrics,
                         overdue_points=target_points,
                     )
-                    await task_metrics_service.refresh_assignee_summaries()
+                    task_metrics_service.schedule_assignee_summary_refresh()
 
                     await notion_service.record_audit_log(
                         task_page_id=page_id,
@@ -2036,6 +2031,29 @@ def determine_reminder_stage(snapshot, reference_time: datetime) -> Optional[str
     return REMINDER_STAGE_OVERDUE
 
 
+def _should_notify_reminder(snapshot, stage: str) -> bool:
+    """判定済みのステージについて、今回リマインドを送るべきかどうか判定"""
+    if stage == REMINDER_STAGE_BEFORE:
+        # 期日前は一度だけ通知（従来通り）
+        return stage != snapshot.reminder_stage
+    if stage == REMINDER_STAGE_DUE:
+        # 当日は既読になるまで毎回通知
+        if getattr(snapshot, "has_due_read_prop", False):
+            return not getattr(snapshot, "due_stage_read", False)
+        # 後方互換: 従来の既読フラグで制御（押されるまで送る）
+        return not getattr(snapshot, "reminder_read", False)
+    if stage == REMINDER_STAGE_OVERDUE:
+        # 超過は必ず一度は通知し、その後は既読で止める
+        if getattr(snapshot, "has_overdue_read_prop", False):
+            return not getattr(snapshot, "overdue_stage_read", False)
+        # 後方互換: ステージが超過に変わったら少なくとも一度は送る。以後は従来の既読で止める。
+        if snapshot.reminder_stage != REMINDER_STAGE_OVERDUE:
+            return True
+        return not getattr(snapshot, "reminder_read", False)
+    # その他はステージ変化時のみ
+    return stage != snapshot.reminder_stage
+
+
 def _should_clear_overdue_points(snapshot, reference_time: datetime) -> bool:
     """納期超過ポイントをクリアすべきかどうか判定"""
     due = getattr(snapshot, "due_date", None)
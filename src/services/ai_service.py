@@ -50,19 +50,27 @@ class ConversationHistory:
 
     def _load_from_disk(self):
         try:
-            if self.storage_path.exists():
-                data = json.loads(self.storage_path.read_text(encoding="utf-8"))
-                for sid, msgs in data.items():
-                    self.conversations[sid] = [
-                        ConversationMessage(
-                            role=m.get("role", "user"),
-                            content=m.get("content", ""),
-                            timestamp=datetime.fromisoformat(m.get("timestamp"))
-                            if m.get("timestamp")
-                            else datetime.now(),
-                        )
-                        for m in msgs
-                    ]
+            # exists()で事前確認せず直接読み込む（stat分のシステムコールとTOCTOUを避ける）
+            data = json.loads(self.storage_path.read_bytes())
+        except FileNotFoundError:
+            return
+        except Exception:
+            # 読み込み失敗時は空として扱う（壊れたファイルでも稼働を止めない）
+            self.conversations = {}
+            return
+
+        try:
+            for sid, msgs in data.items():
+                self.conversations[sid] = [
+                    ConversationMessage(
+                        role=m.get("role", "user"),
+                        content=m.get("content", ""),
+                        timestamp=datetime.fromisoformat(m.get("timestamp"))
+                        if m.get("timestamp")
+                        else datetime.now(),
+                    )
+                    for m in msgs
+                ]
         except Exception:
             # 読み込み失敗時は空として扱う（壊れたファイルでも稼働を止めない）
             self.conversations = {}
@@ -1,15 +1,29 @@
 import asyncio
+import contextvars
+import functools
+from concurrent.futures import Executor
 from contextlib import asynccontextmanager
 from typing import AsyncIterator, Awaitable, Callable, Optional, TypeVar
 
 T = TypeVar("T")
 
 
+async def run_in_executor(executor: Executor, func: Callable[..., T], *args, **kwargs) -> T:
+    """Like asyncio.to_thread, but run on the given executor instead of the loop's default one."""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    return await loop.run_in_executor(executor, call)
+
+
 class AsyncToThreadRunner:
-    """Run blocking callables in a background thread with bounded concurrency."""
+    """Run blocking callables in a background thread with bounded concurrency.
 
-    def __init__(self, max_concurrency: int = 8):
+    Pass ``executor`` to keep these calls off the event loop's default executor.
+    """
+
+    def __init__(self, max_concurrency: int = 8, executor: Optional[Executor] = None):
         self._coordinator = ConcurrencyCoordinator(max_concurrency=max_concurrency)
+        self._executor = executor
 
     async def run(
         self,
@@ -19,6 +33,8 @@ class AsyncToThreadRunner:
         **kwargs,
     ) -> T:
         async with self._coordinator.guard(key):
+            if self._executor is not None:
+                return await run_in_executor(self._executor, func, *args, **kwargs)
             return await asyncio.to_thread(func, *args, **kwargs)
 
 
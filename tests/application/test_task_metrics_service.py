@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from src.application.services.task_metrics_service import (
+    SUMMARY_REFRESH_MAX_ATTEMPTS,
+    TaskMetricsApplicationService,
+)
+
+
+class _FakeAdminMetricsService:
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.fetch_calls = 0
+        self.upserted = []
+
+    async def fetch_all_metrics(self):
+        self.fetch_calls += 1
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("notion unavailable")
+        return ()
+
+    async def upsert_assignee_summaries(self, summaries):
+        self.upserted.append(list(summaries))
+
+
+def test_scheduled_refreshes_are_coalesced():
+    admin = _FakeAdminMetricsService()
+    service = TaskMetricsApplicationService(admin)
+
+    async def scenario():
+        for _ in range(5):
+            service.schedule_assignee_summary_refresh(delay_seconds=0.01)
+        await asyncio.wait_for(service._summary_refresh_task, timeout=1)
+
+    asyncio.run(scenario())
+
+    assert admin.fetch_calls == 1
+    assert len(admin.upserted) == 1
+    assert not service._summary_dirty
+
+
+def test_failed_refresh_stays_dirty_and_is_retried():
+    admin = _FakeAdminMetricsService(failures=1)
+    service = TaskMetricsApplicationService(admin)
+
+    async def scenario():
+        service.schedule_assignee_summary_refresh(delay_seconds=0.01)
+        await asyncio.wait_for(service._summary_refresh_task, timeout=1)
+
+    asyncio.run(scenario())
+
+    assert admin.fetch_calls == 2
+    assert len(admin.upserted) == 1
+    assert not service._summary_dirty
+
+
+def test_repeated_failures_stop_retrying_but_stay_dirty():
+    admin = _FakeAdminMetricsService(failures=SUMMARY_REFRESH_MAX_ATTEMPTS + 1)
+    service = TaskMetricsApplicationService(admin)
+
+    async def scenario():
+        service.schedule_assignee_summary_refresh(delay_seconds=0.01)
+        await asyncio.wait_for(service._summary_refresh_task, timeout=1)
+
+    asyncio.run(scenario())
+
+    assert admin.fetch_calls == SUMMARY_REFRESH_MAX_ATTEMPTS
+    assert admin.upserted == []
+    assert service._summary_dirty
+
+
+def test_direct_refresh_failure_marks_dirty():
+    admin = _FakeAdminMetricsService(failures=1)
+    service = TaskMetricsApplicationService(admin)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(service.refresh_assignee_summaries())
+
+    assert service._summary_dirty
+
+
+def test_flush_runs_pending_refresh_without_waiting_for_debounce():
+    admin = _FakeAdminMetricsService()
+    service = TaskMetricsApplicationService(admin)
+
+    async def scenario():
+        service.schedule_assignee_summary_refresh(delay_seconds=60)
+        await asyncio.wait_for(service.flush_pending_summary_refresh(), timeout=1)
+        # フラッシュ済みなら追加の再集計は行わない
+        await service.flush_pending_summary_refresh()
+
+    asyncio.run(scenario())
+
+    assert admin.fetch_calls == 1
+    assert len(admin.upserted) == 1
+    assert not service._summary_dirty
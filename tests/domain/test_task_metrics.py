@@ -0,0 +1,70 @@
+from dataclasses import FrozenInstanceError, replace
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.domain.entities.task_metrics import TaskMetricsRecord
+
+
+def _record(**overrides) -> TaskMetricsRecord:
+    values = dict(
+        task_page_id="task-1",
+        task_title="Task 1",
+        assignee_email="user@example.com",
+        assignee_notion_id="notion-1",
+        assignee_name=None,
+        due_date=datetime(2024, 1, 1, 9, 0, tzinfo=timezone(timedelta(hours=9))),
+        status="承認済み",
+        reminder_stage=None,
+    )
+    values.update(overrides)
+    return TaskMetricsRecord(**values)
+
+
+@pytest.mark.parametrize(
+    ("status", "completion_status", "expected"),
+    [
+        ("完了", None, True),
+        (" 完了 ", None, True),
+        ("承認済み", "完了承認", True),
+        ("承認済み", "完了", True),
+        ("承認済み", "差し戻し", False),
+        (None, None, False),
+    ],
+)
+def test_is_completed_is_derived_from_status_labels(status, completion_status, expected):
+    record = _record(status=status, completion_status=completion_status)
+
+    assert record.is_completed is expected
+
+
+def test_due_date_utc_normalizes_aware_and_naive_values():
+    aware = _record()
+    naive = _record(due_date=datetime(2024, 1, 1, 9, 0))
+    missing = _record(due_date=None)
+
+    assert aware.due_date_utc == datetime(2024, 1, 1, 0, 0, tzinfo=timezone.utc)
+    assert aware.due_date_utc.tzinfo is timezone.utc
+    assert aware.due_date.utcoffset() == timedelta(hours=9)
+    assert naive.due_date_utc == datetime(2024, 1, 1, 9, 0, tzinfo=timezone.utc)
+    assert missing.due_date_utc is None
+
+
+def test_assignee_key_falls_back_to_notion_id_then_unassigned():
+    assert _record().assignee_key == "user@example.com"
+    assert _record(assignee_email=None).assignee_key == "notion-1"
+    assert _record(assignee_email=None, assignee_notion_id=None).assignee_key == "__unassigned__"
+
+
+def test_record_is_immutable_and_replace_recomputes_derived_fields():
+    record = _record()
+
+    with pytest.raises(FrozenInstanceError):
+        record.status = "完了"
+
+    updated = replace(record, status="完了", assignee_email=None, due_date=None)
+
+    assert updated.is_completed is True
+    assert updated.assignee_key == "notion-1"
+    assert updated.due_date_utc is None
+    assert record.is_completed is False
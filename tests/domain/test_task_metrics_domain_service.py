@@ -1,3 +1,4 @@
+import random
 from datetime import datetime, timedelta, timezone
 
 from src.domain.entities.task_metrics import TaskMetricsRecord
@@ -76,3 +77,103 @@ def test_completed_tasks_not_counted_as_overdue():
     assert summaries[0].overdue_tasks == 0
     assert summaries[0].due_within_three_days == 1
     assert summaries[0].total_overdue_points == 4
+
+
+def _reference_summary_counts(records, reference):
+    """レコードを1件ずつ判定する素朴な集計（build_assignee_summaries の比較用）"""
+    due_soon_threshold = reference + timedelta(days=3)
+    grouped: dict[str, list[TaskMetricsRecord]] = {}
+    for record in records:
+        key = record.assignee_email or record.assignee_notion_id or "__unassigned__"
+        grouped.setdefault(key, []).append(record)
+
+    results = []
+    for group in grouped.values():
+        counts = {
+            "total_tasks": len(group),
+            "open_tasks": 0,
+            "completed_tasks": 0,
+            "overdue_tasks": 0,
+            "due_within_three_days": 0,
+            "next_due_date": None,
+            "total_overdue_points": 0,
+        }
+        for record in group:
+            counts["total_overdue_points"] += max(record.overdue_points, 0)
+            completed = (record.status or "").strip() == "完了" or (
+                record.completion_status or ""
+            ).strip() in ("完了承認", "完了")
+            if completed:
+                counts["completed_tasks"] += 1
+                continue
+            counts["open_tasks"] += 1
+            if record.due_date is None:
+                continue
+            due_date = record.due_date
+            if due_date.tzinfo is None:
+                due_date = due_date.replace(tzinfo=timezone.utc)
+            due_date = due_date.astimezone(timezone.utc)
+            if due_date < reference:
+                counts["overdue_tasks"] += 1
+                continue
+            if due_date <= due_soon_threshold:
+                counts["due_within_three_days"] += 1
+            if counts["next_due_date"] is None or due_date < counts["next_due_date"]:
+                counts["next_due_date"] = due_date
+        results.append((group[0].assignee_email, group[0].assignee_notion_id, counts))
+    return results
+
+
+def test_build_assignee_summaries_matches_per_record_reference():
+    rng = random.Random(20240101)
+    service = TaskMetricsDomainService()
+    reference = datetime(2024, 1, 10, tzinfo=timezone.utc)
+    statuses = [None, "承認済み", "完了", " 完了 ", "差し戻し"]
+    completion_statuses = [None, "進行中", "完了承認", "完了", "差し戻し"]
+    emails = [None, "a@example.com", "b@example.com", "c@example.com"]
+    notion_ids = [None, "notion-a", "notion-b"]
+    zones = [timezone.utc, timezone(timedelta(hours=9)), None]
+
+    for _ in range(50):
+        records = []
+        for index in range(rng.randint(0, 30)):
+            due_date = None
+            if rng.random() < 0.8:
+                due_date = reference + timedelta(hours=rng.randint(-240, 240))
+                zone = rng.choice(zones)
+                due_date = due_date.astimezone(zone) if zone else due_date.replace(tzinfo=None)
+            records.append(
+                TaskMetricsRecord(
+                    task_page_id=str(index),
+                    task_title=f"Task {index}",
+                    assignee_email=rng.choice(emails),
+                    assignee_notion_id=rng.choice(notion_ids),
+                    assignee_name=None,
+                    due_date=due_date,
+                    status=rng.choice(statuses),
+                    reminder_stage=None,
+                    overdue_points=rng.randint(-2, 5),
+                    completion_status=rng.choice(completion_statuses),
+                    extension_status=None,
+                )
+            )
+
+        summaries = service.build_assignee_summaries(records, reference)
+        actual = [
+            (
+                summary.assignee_email,
+                summary.assignee_notion_id,
+                {
+                    "total_tasks": summary.total_tasks,
+                    "open_tasks": summary.open_tasks,
+                    "completed_tasks": summary.completed_tasks,
+                    "overdue_tasks": summary.overdue_tasks,
+                    "due_within_three_days": summary.due_within_three_days,
+                    "next_due_date": summary.next_due_date,
+                    "total_overdue_points": summary.total_overdue_points,
+                },
+            )
+            for summary in summaries
+        ]
+
+        assert actual == _reference_summary_counts(records, reference)
@@ -0,0 +1,97 @@
+import random
+
+from src.domain.entities.notion_user import NotionUser
+from src.domain.entities.slack_user import SlackUser
+from src.domain.services.user_mapping_domain_service import UserMappingDomainService
+from src.domain.value_objects.email import Email
+from src.domain.value_objects.notion_user_id import NotionUserId
+from src.domain.value_objects.slack_user_id import SlackUserId
+
+
+def _notion_user(index: int, email: str) -> NotionUser:
+    return NotionUser(
+        user_id=NotionUserId(f"{index:032x}"),
+        name=f"Notion {index}",
+        email=Email(email),
+        user_type="person",
+        object_type="user",
+    )
+
+
+def _slack_user(index: int, email: str) -> SlackUser:
+    return SlackUser(
+        user_id=SlackUserId(f"U{index:010d}"),
+        username=f"slack{index}",
+        email=Email(email),
+    )
+
+
+def _linear_scan_mapping(slack_user, notion_users):
+    """索引化前の線形検索と同じ判定（比較用）"""
+    for notion_user in notion_users:
+        if notion_user.email.normalized() == slack_user.email.normalized():
+            return notion_user, "email_exact"
+    domain_matches = [
+        user for user in notion_users if user.email.domain() == slack_user.email.domain()
+    ]
+    if len(domain_matches) == 1:
+        return domain_matches[0], "email_domain"
+    return None
+
+
+def test_exact_match_takes_priority_and_first_duplicate_wins():
+    service = UserMappingDomainService()
+    notion_users = [
+        _notion_user(1, "other@example.com"),
+        _notion_user(2, "Taro@Example.com"),
+        _notion_user(3, "taro@example.com"),
+    ]
+
+    mapping = service.find_best_mapping(_slack_user(1, "taro@example.com"), notion_users)
+
+    assert mapping is not None
+    assert mapping.mapping_source == "email_exact"
+    assert mapping.notion_user is notion_users[1]
+
+
+def test_domain_match_requires_a_single_candidate():
+    service = UserMappingDomainService()
+    unique_domain = [_notion_user(1, "a@solo.example.com"), _notion_user(2, "b@shared.example.com")]
+    shared_domain = unique_domain + [_notion_user(3, "c@shared.example.com")]
+
+    solo = service.find_best_mapping(_slack_user(1, "x@solo.example.com"), unique_domain)
+    shared = service.find_best_mapping(_slack_user(2, "x@shared.example.com"), shared_domain)
+
+    assert solo is not None
+    assert solo.mapping_source == "email_domain"
+    assert solo.notion_user is unique_domain[0]
+    assert shared is None
+
+
+def test_bulk_mapping_matches_single_user_mapping_and_linear_scan():
+    service = UserMappingDomainService()
+    rng = random.Random(1)
+    domains = ["a.example.com", "B.example.com", "b.example.com", "c.example.org"]
+
+    def random_email() -> str:
+        return f"{rng.choice(['x', 'y', 'Z', 'w'])}{rng.randint(0, 5)}@{rng.choice(domains)}"
+
+    for _ in range(200):
+        notion_users = [_notion_user(i, random_email()) for i in range(rng.randint(0, 8))]
+        slack_users = [_slack_user(i, random_email()) for i in range(5)]
+
+        bulk = service.find_best_mapping_bulk(slack_users, notion_users)
+
+        for slack_user in slack_users:
+            single = service.find_best_mapping(slack_user, notion_users)
+            expected = _linear_scan_mapping(slack_user, notion_users)
+            from_bulk = bulk.get(slack_user.user_id)
+
+            if expected is None:
+                assert single is None
+                assert from_bulk is None
+                continue
+            for mapping in (single, from_bulk):
+                assert mapping is not None
+                assert mapping.notion_user is expected[0]
+                assert mapping.mapping_source == expected[1]
@@ -3,6 +3,7 @@ from types import SimpleNamespace
 
 from src.infrastructure.notion.dynamic_notion_service import (
     REMINDER_STAGE_BEFORE,
+    REMINDER_STAGE_DUE,
     REMINDER_STAGE_OVERDUE,
     REMINDER_STAGE_PENDING_APPROVAL,
     EXTENSION_STATUS_PENDING,
@@ -14,6 +15,7 @@ from src.infrastructure.notion.dynamic_notion_service import (
 from src.presentation.api.slack_endpoints import (
     determine_reminder_stage,
     _should_clear_overdue_points,
+    _should_notify_reminder,
 )
 
 
@@ -103,3 +105,31 @@ def test_should_keep_points_when_completion_requested_late():
 
     assert not _should_clear_overdue_points(snapshot, now)
 
+
+
+def test_should_notify_before_due_only_once():
+    snapshot = _snapshot(reminder_stage=None)
+
+    assert _should_notify_reminder(snapshot, REMINDER_STAGE_BEFORE)
+    snapshot.reminder_stage = REMINDER_STAGE_BEFORE
+    assert not _should_notify_reminder(snapshot, REMINDER_STAGE_BEFORE)
+
+
+def test_should_notify_due_until_read():
+    unread = _snapshot(reminder_stage=REMINDER_STAGE_DUE, has_due_read_prop=True, due_stage_read=False)
+    read = _snapshot(reminder_stage=REMINDER_STAGE_DUE, has_due_read_prop=True, due_stage_read=True)
+    legacy_read = _snapshot(reminder_stage=REMINDER_STAGE_DUE, reminder_read=True)
+
+    assert _should_notify_reminder(unread, REMINDER_STAGE_DUE)
+    assert not _should_notify_reminder(read, REMINDER_STAGE_DUE)
+    assert not _should_notify_reminder(legacy_read, REMINDER_STAGE_DUE)
+
+
+def test_should_notify_overdue_at_least_once_without_read_property():
+    changed = _snapshot(reminder_stage=REMINDER_STAGE_DUE, reminder_read=True)
+    repeated_read = _snapshot(reminder_stage=REMINDER_STAGE_OVERDUE, reminder_read=True)
+    repeated_unread = _snapshot(reminder_stage=REMINDER_STAGE_OVERDUE, reminder_read=False)
+
+    assert _should_notify_reminder(changed, REMINDER_STAGE_OVERDUE)
+    assert not _should_notify_reminder(repeated_read, REMINDER_STAGE_OVERDUE)
+    assert _should_notify_reminder(repeated_unread, REMINDER_STAGE_OVERDUE)